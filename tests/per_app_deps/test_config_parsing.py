@@ -3,6 +3,7 @@
 Tests for per-app dependency configuration parsing and validation.
 """
 
+import os
 import sys
 from pathlib import Path
 import pytest
@@ -17,6 +18,8 @@ from app_dependencies import (
     should_use_per_app_deps,
     get_app_deps_config,
     get_app_kit_path,
+    get_app_kit_executable,
+    clear_kit_executable_cache,
     get_kit_sdk_version,
     validate_deps_config,
     initialize_per_app_deps,
@@ -81,6 +84,15 @@ class TestConfigParsing:
         assert version is not None
         assert isinstance(version, str)
 
+    def test_config_reloaded_after_file_changes(self, test_app_with_deps_config):
+        """Cached config should be re-parsed once kit-deps.toml changes."""
+        config_file = test_app_with_deps_config / "dependencies" / "kit-deps.toml"
+        assert get_app_deps_config(test_app_with_deps_config) is \
+            get_app_deps_config(test_app_with_deps_config)
+
+        config_file.write_text('[kit_sdk]\nversion = "107.3"\n')
+        assert get_kit_sdk_version(test_app_with_deps_config) == '107.3'
+
 
 class TestKitPathResolution:
     """Test Kit SDK path resolution."""
@@ -97,6 +109,38 @@ class TestKitPathResolution:
         assert kit_path.name == "_kit"
         assert kit_path.parent == test_app_path
 
+    def test_get_app_kit_executable(self, test_app_path):
+        """Should find the per-app Kit executable once it is installed."""
+        assert get_app_kit_executable(test_app_path) is None
+
+        # An empty SDK directory is probed and its (negative) result cached;
+        # backdate it so adding the executable visibly changes its mtime
+        kit_dir = test_app_path / "_kit" / "kit"
+        kit_dir.mkdir(parents=True)
+        os.utime(kit_dir, ns=(0, 0))
+        assert get_app_kit_executable(test_app_path) is None
+
+        # No cache clear: the directory's new mtime invalidates the entry
+        (kit_dir / "kit").write_text("")
+        assert get_app_kit_executable(test_app_path) == kit_dir / "kit"
+
+    def test_clear_kit_executable_cache(self, test_app_path):
+        """Clearing the cache should drop results for an unchanged directory."""
+        kit_dir = test_app_path / "_kit" / "kit"
+        kit_dir.mkdir(parents=True)
+        (kit_dir / "kit").write_text("")
+        assert get_app_kit_executable(test_app_path) == kit_dir / "kit"
+
+        # Remove the executable but keep the directory's mtime, so the
+        # cached result still applies until the cache is cleared
+        mtime_ns = os.stat(kit_dir).st_mtime_ns
+        (kit_dir / "kit").unlink()
+        os.utime(kit_dir, ns=(mtime_ns, mtime_ns))
+        assert get_app_kit_executable(test_app_path) == kit_dir / "kit"
+
+        clear_kit_executable_cache()
+        assert get_app_kit_executable(test_app_path) is None
+
 
 class TestConfigValidation:
     """Test configuration validation."""
@@ -190,7 +234,7 @@ class TestConfigInitialization:
         assert 'cache' in config
         assert 'dependencies' in config
         assert config['kit_sdk']['version'] == "106.0"
-        assert config['cache']['strategy'] == "isolated"
+        assert config['cache']['strategy'] == "shared"
 
 
 class TestBackwardCompatibility:
@@ -236,7 +280,7 @@ class TestAppListing:
         initialize_per_app_deps(app3)
 
         # List apps
-        apps = list_apps_with_per_app_deps(tmp_path)
+        apps = list(list_apps_with_per_app_deps(tmp_path))
         app_names = [app.name for app in apps]
 
         assert len(apps) == 2
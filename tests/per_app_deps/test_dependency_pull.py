@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Tests for the per-app dependency puller's up-to-date check.
+"""
+
+import sys
+from pathlib import Path
+import pytest
+
+# Add repoman tools to path
+repo_root = Path(__file__).parent.parent.parent
+tools_path = repo_root / "tools" / "repoman"
+if str(tools_path) not in sys.path:
+    sys.path.insert(0, str(tools_path))
+
+import per_app_deps_puller
+
+
+def _fake_packman(tmp_path, name, exit_code):
+    """Write a packman stand-in that logs each call and creates _kit/kit."""
+    script = tmp_path / name
+    script.write_text(
+        "#!/bin/sh\n"
+        f"echo pull >> '{tmp_path / 'calls.log'}'\n"
+        "mkdir -p _kit/kit\n"
+        f"exit {exit_code}\n"
+    )
+    script.chmod(0o755)
+    return script
+
+
+def _packman_calls(tmp_path):
+    log = tmp_path / "calls.log"
+    return len(log.read_text().split()) if log.exists() else 0
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="uses a shell script as packman")
+class TestPullStamp:
+    """Test that the pull stamp only skips pulls that succeeded."""
+
+    def test_up_to_date_pull_is_skipped(self, test_app_with_deps_config, tmp_path, monkeypatch):
+        """A second pull of unchanged XML should not run packman."""
+        packman = _fake_packman(tmp_path, "packman_ok", 0)
+        monkeypatch.setattr(per_app_deps_puller, "get_packman_executable", lambda: packman)
+
+        assert per_app_deps_puller.pull_app_dependencies(test_app_with_deps_config)
+        assert per_app_deps_puller.pull_app_dependencies(test_app_with_deps_config)
+        assert _packman_calls(tmp_path) == 1
+
+    def test_failed_pull_with_fallback_is_retried(
+        self, test_app_with_deps_config, tmp_path, monkeypatch
+    ):
+        """After a failed pull rescued by the fallback copy, the next run pulls again."""
+        app = test_app_with_deps_config
+        ok = _fake_packman(tmp_path, "packman_ok", 0)
+        failing = _fake_packman(tmp_path, "packman_fail", 1)
+        fallback_calls = []
+        monkeypatch.setattr(
+            per_app_deps_puller, "copy_global_kit_to_app",
+            lambda app_path: fallback_calls.append(app_path) or True
+        )
+
+        monkeypatch.setattr(per_app_deps_puller, "get_packman_executable", lambda: ok)
+        assert per_app_deps_puller.pull_app_dependencies(app)
+
+        monkeypatch.setattr(per_app_deps_puller, "get_packman_executable", lambda: failing)
+        assert per_app_deps_puller.pull_app_dependencies(app, force=True)
+        assert fallback_calls == [app]
+
+        monkeypatch.setattr(per_app_deps_puller, "get_packman_executable", lambda: ok)
+        assert per_app_deps_puller.pull_app_dependencies(app)
+        assert _packman_calls(tmp_path) == 3
@@ -250,9 +250,12 @@ class TestCreateApplication:
         assert isinstance(result['app_dir'], str)
         assert isinstance(result['kit_file'], str)
 
+    @patch.object(TemplateAPI, '_manual_create_application', return_value=None)
     @patch.object(TemplateAPI, 'generate_and_execute_template')
-    def test_create_application_failure(self, mock_generate_execute):
+    def test_create_application_failure(self, mock_generate_execute, mock_manual):
         """Test failed application creation."""
+        # The manual fallback is stubbed out: it would materialize
+        # source/apps/test_app inside the repository
         # Setup mock
         mock_generate_execute.return_value = TemplateGenerationResult(
             success=False,
@@ -336,6 +339,33 @@ class TestCreateApplication:
             assert 'error' in result
 
 
+class TestListTemplatesCache:
+    """Test caching of list_templates() and get_template()."""
+
+    def test_listing_is_discovered_once(self):
+        """Repeated listings and lookups reuse one discovery pass."""
+        api = TemplateAPI()
+        with patch.object(api.engine, 'list_templates',
+                          wraps=api.engine.list_templates) as mock_list:
+            first = api.list_templates()
+            assert api.list_templates() == first
+            assert api.get_template(first[0].name) == first[0]
+            assert api.get_template('no_such_template') is None
+
+        assert mock_list.call_count == 1
+
+    def test_invalidate_rediscovers(self):
+        """invalidate() forces the next listing to re-discover."""
+        api = TemplateAPI()
+        api.list_templates()
+        api.invalidate()
+        with patch.object(api.engine, 'list_templates',
+                          wraps=api.engine.list_templates) as mock_list:
+            api.list_templates()
+
+        assert mock_list.call_count == 1
+
+
 class TestMethodSignatures:
     """Test that method signatures are correct."""
 
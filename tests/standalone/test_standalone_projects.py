@@ -7,46 +7,130 @@ independently of the repository.
 """
 
 import os
+import re
 import pytest
 import subprocess
 import shutil
 import tempfile
 from pathlib import Path
 import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
 # Repository root
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
+REPO_ROOT_STR = os.fspath(REPO_ROOT)
+REPO_SH = os.fspath(REPO_ROOT / "repo.sh")
+
+# Environment for headless launches; QT/GL overrides skip the GPU probe on CI
+_HEADLESS_ENV = {
+    **os.environ,
+    "DISPLAY": ":99",
+    "QT_QPA_PLATFORM": "offscreen",
+    "LIBGL_ALWAYS_SOFTWARE": "1",
+}
+
+# Matches the existing-directory warning on raw stderr bytes
+_WARN_RE = re.compile(rb"warning|already exists", re.IGNORECASE)
+
+# Lines of build output kept for failure reports
+_TAIL_LINES = 200
+
+
+def _drain(stream, maxlen=_TAIL_LINES):
+    """Read a pipe to EOF, keeping only the last ``maxlen`` lines."""
+    with stream:
+        return "".join(deque(stream, maxlen=maxlen))
+
+
+def _run_build(cmd, cwd, timeout):
+    """
+    Run a long build subprocess, draining stdout/stderr on worker threads.
+
+    Both pipes are read concurrently into bounded tails while the main thread
+    blocks in ``wait()``, so a chatty build never stalls on a full pipe and
+    its output never accumulates in memory.
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        cwd=cwd
+    )
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        stdout = pool.submit(_drain, proc.stdout)
+        stderr = pool.submit(_drain, proc.stderr)
+        try:
+            returncode = proc.wait(timeout=timeout)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.wait()
+            raise
+        return SimpleNamespace(
+            returncode=returncode,
+            stdout=stdout.result(),
+            stderr=stderr.result()
+        )
 
 
-class TestStandaloneProjectCreation:
-    """Test standalone project creation from templates."""
+def _template_new(name, cwd, output_dir=None):
+    """
+    Run ``repo.sh template new --standalone`` for ``name``.
+
+    No ``preexec_fn`` and no ``shell=True``, so the child is spawned without
+    running Python code between fork and exec.
+    """
+    cmd = [
+        REPO_SH, "template", "new", "kit_base_editor",
+        "--name", name,
+        "--standalone",
+        "--accept-license"
+    ]
+    if output_dir is not None:
+        cmd[5:5] = ["--output-dir", str(output_dir)]
+    return subprocess.run(
+        cmd,
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        timeout=120
+    )
+
+
+@pytest.fixture(scope="module")
+def created_projects(tmp_path_factory):
+    """
+    Create the standalone projects used by the creation tests once per module.
+
+    The invocations run one after another: each replay rewrites repo.toml
+    and source/apps/ in the shared repo root, which is not safe to do
+    concurrently. Each test picks its ``(result, directory)`` pair out of
+    the returned dict by app name.
+    """
+    root = tmp_path_factory.mktemp("standalone_batch")
+    default_cwd = root / "default_cwd"
+    default_cwd.mkdir()
+
+    jobs = {
+        "test_standalone": (REPO_ROOT_STR, root / "test_standalone"),
+        "test_structure": (REPO_ROOT_STR, root / "test_structure"),
+        "test_default": (default_cwd, None),
+    }
+    return {
+        name: (_template_new(name, cwd, output_dir), output_dir or cwd / name)
+        for name, (cwd, output_dir) in jobs.items()
+    }
 
-    def setup_method(self):
-        """Create temporary directory for tests."""
-        self.temp_dir = Path(tempfile.mkdtemp(prefix="standalone_test_"))
 
-    def teardown_method(self):
-        """Clean up temporary directory."""
-        if self.temp_dir.exists():
-            shutil.rmtree(self.temp_dir)
+class TestStandaloneProjectCreation:
+    """Test standalone project creation from templates."""
 
-    def test_standalone_flag_creates_project(self):
+    def test_standalone_flag_creates_project(self, created_projects):
         """Test that --standalone flag creates a standalone project."""
-        standalone_dir = self.temp_dir / "test_standalone"
-
-        result = subprocess.run(
-            [
-                "./repo.sh", "template", "new", "kit_base_editor",
-                "--name", "test_standalone",
-                "--output-dir", str(standalone_dir),
-                "--standalone",
-                "--accept-license"
-            ],
-            capture_output=True,
-            text=True,
-            cwd=REPO_ROOT,
-            timeout=120
-        )
+        result, standalone_dir = created_projects["test_standalone"]
 
         print(f"stdout: {result.stdout}")
         print(f"stderr: {result.stderr}")
@@ -54,24 +138,9 @@ class TestStandaloneProjectCreation:
         assert result.returncode == 0, f"Failed to create standalone project: {result.stderr}"
         assert standalone_dir.exists(), "Standalone directory not created"
 
-    def test_standalone_structure_complete(self):
+    def test_standalone_structure_complete(self, created_projects):
         """Verify standalone project has all required files."""
-        standalone_dir = self.temp_dir / "test_structure"
-
-        # Create standalone project
-        result = subprocess.run(
-            [
-                "./repo.sh", "template", "new", "kit_base_editor",
-                "--name", "test_structure",
-                "--output-dir", str(standalone_dir),
-                "--standalone",
-                "--accept-license"
-            ],
-            capture_output=True,
-            text=True,
-            cwd=REPO_ROOT,
-            timeout=120
-        )
+        result, standalone_dir = created_projects["test_structure"]
 
         assert result.returncode == 0
 
@@ -95,53 +164,44 @@ class TestStandaloneProjectCreation:
 
         print("✓ All required files present")
 
-    def test_standalone_with_default_output_dir(self):
+    def test_standalone_with_default_output_dir(self, created_projects):
         """Test standalone project with default output directory."""
-        # Create in current directory (use temp dir as cwd)
-        result = subprocess.run(
-            [
-                str(REPO_ROOT / "repo.sh"), "template", "new", "kit_base_editor",
-                "--name", "test_default",
-                "--standalone",
-                "--accept-license"
-            ],
-            capture_output=True,
-            text=True,
-            cwd=self.temp_dir,
-            timeout=120
-        )
+        # Created with a scratch directory as cwd and no --output-dir
+        result, standalone_dir = created_projects["test_default"]
 
         print(f"stdout: {result.stdout}")
         print(f"stderr: {result.stderr}")
 
         assert result.returncode == 0
-        assert (self.temp_dir / "test_default").exists(), "Default output directory not created"
+        assert standalone_dir.exists(), "Default output directory not created"
 
-    def test_standalone_warns_on_existing_directory(self):
+    def test_standalone_warns_on_existing_directory(self, tmp_path):
         """Test that standalone warns if directory already exists."""
-        standalone_dir = self.temp_dir / "test_existing"
+        # Unique name so parallel workers never collide on the same app
+        app_name = f"test_existing_{uuid.uuid4().hex[:8]}"
+        standalone_dir = tmp_path / app_name
         standalone_dir.mkdir()
 
-        result = subprocess.run(
-            [
-                "./repo.sh", "template", "new", "kit_base_editor",
-                "--name", "test_existing",
-                "--output-dir", str(standalone_dir),
-                "--standalone",
-                "--accept-license"
-            ],
-            capture_output=True,
-            text=True,
-            cwd=REPO_ROOT,
-            timeout=120
-        )
+        try:
+            result = subprocess.run(
+                [
+                    "./repo.sh", "template", "new", "kit_base_editor",
+                    "--name", app_name,
+                    "--output-dir", str(standalone_dir),
+                    "--standalone",
+                    "--accept-license"
+                ],
+                capture_output=True,
+                cwd=REPO_ROOT_STR,
+                timeout=120
+            )
+        finally:
+            # The template itself is still written under source/apps/
+            shutil.rmtree(REPO_ROOT / "source" / "apps" / app_name, ignore_errors=True)
 
         # Template creation succeeds, but standalone generation warns
         assert result.returncode == 0, "Template creation should succeed"
-        assert "Warning" in result.stderr or "already exists" in result.stderr, "Should warn about existing directory"
-
-        # Template should be created in source/apps/ even if standalone fails
-        assert (REPO_ROOT / "source" / "apps" / "test_existing").exists(), "Template should be created"
+        assert _WARN_RE.search(result.stderr), "Should warn about existing directory"
 
 
 class TestStandaloneBuild:
@@ -163,7 +223,7 @@ class TestStandaloneBuild:
             ],
             capture_output=True,
             text=True,
-            cwd=REPO_ROOT,
+            cwd=REPO_ROOT_STR,
             timeout=120
         )
 
@@ -179,10 +239,8 @@ class TestStandaloneBuild:
         """Test that standalone project can be built."""
         print(f"\nBuilding standalone project: {self.standalone_dir}")
 
-        result = subprocess.run(
+        result = _run_build(
             ["./repo.sh", "build", "--config", "release"],
-            capture_output=True,
-            text=True,
             cwd=self.standalone_dir,
             timeout=600  # 10 minutes for build
         )
@@ -204,10 +262,8 @@ class TestStandaloneBuild:
         print(f"\nBuilding and launching standalone project: {self.standalone_dir}")
 
         # Build first
-        build_result = subprocess.run(
+        build_result = _run_build(
             ["./repo.sh", "build", "--config", "release"],
-            capture_output=True,
-            text=True,
             cwd=self.standalone_dir,
             timeout=600
         )
@@ -215,17 +271,14 @@ class TestStandaloneBuild:
         assert build_result.returncode == 0, f"Build failed: {build_result.stderr}"
 
         # Launch (headless)
-        env = os.environ.copy()
-        env["DISPLAY"] = ":99"  # Headless
-
         proc = subprocess.Popen(
             ["./repo.sh", "launch", "--name", "test_build_standalone.kit"],
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
             cwd=self.standalone_dir,
-            env=env,
-            preexec_fn=os.setsid  # Process group for cleanup
+            env=_HEADLESS_ENV,
+            start_new_session=True  # Process group for cleanup
         )
 
         try:
@@ -278,7 +331,7 @@ class TestStandaloneIndependence:
             ],
             capture_output=True,
             text=True,
-            cwd=REPO_ROOT,
+            cwd=REPO_ROOT_STR,
             timeout=120
         )
 
@@ -289,10 +342,8 @@ class TestStandaloneIndependence:
         shutil.move(str(original_dir), str(moved_dir))
 
         # Build from new location
-        build_result = subprocess.run(
+        build_result = _run_build(
             ["./repo.sh", "build", "--config", "release"],
-            capture_output=True,
-            text=True,
             cwd=moved_dir,
             timeout=600
         )
@@ -3,3 +3,15 @@ import pytest
 
 if os.environ.get("PACKMAN_TESTS") != "1":
     pytest.skip("Skipping streaming (omni/Packman) tests by default", allow_module_level=True)
+
+from pathlib import Path
+
+STREAMING_CONFIGS_DIR = Path(__file__).parent.parent.parent / "templates" / "apps" / "streaming_configs"
+
+
+@pytest.fixture(scope="session")
+def streaming_kits():
+    """Streaming template .kit files, globbed once per session (None if the directory is missing)."""
+    if not STREAMING_CONFIGS_DIR.exists():
+        return None
+    return sorted(STREAMING_CONFIGS_DIR.glob("*.kit"))
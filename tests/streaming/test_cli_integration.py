@@ -6,6 +6,8 @@ Tests the command-line integration to ensure streaming flags
 are properly recognized and processed.
 """
 
+import os
+import re
 import subprocess
 import sys
 from pathlib import Path
@@ -14,6 +16,10 @@ import pytest
 
 
 repo_root = Path(__file__).parent.parent.parent
+repo_root_str = os.fspath(repo_root)
+
+# Searched directly on raw stderr bytes (no decode or lowercase copy)
+_UNRECOG_RE = re.compile(rb"unrecognized arguments", re.IGNORECASE)
 
 
 class TestCLIFlags:
@@ -25,7 +31,7 @@ class TestCLIFlags:
             ["./repo.sh", "launch", "--help"],
             capture_output=True,
             text=True,
-            cwd=repo_root
+            cwd=repo_root_str
         )
 
         # Should mention streaming in help
@@ -39,45 +45,40 @@ class TestCLIFlags:
         result = subprocess.run(
             ["./repo.sh", "launch", "--streaming", "--help"],
             capture_output=True,
-            text=True,
-            cwd=repo_root
+            cwd=repo_root_str
         )
 
         # Should not have syntax errors
         assert result.returncode in [0, 2]  # 0 or help exit code
-        assert "unrecognized arguments" not in result.stderr.lower()
+        assert not _UNRECOG_RE.search(result.stderr)
 
     def test_streaming_port_flag_syntax(self):
         """Verify streaming-port flag accepts numeric value."""
         result = subprocess.run(
             ["./repo.sh", "launch", "--streaming-port", "48000", "--help"],
             capture_output=True,
-            text=True,
-            cwd=repo_root
+            cwd=repo_root_str
         )
 
         # Should not have syntax errors
         assert result.returncode in [0, 2]
-        assert "unrecognized arguments" not in result.stderr.lower()
+        assert not _UNRECOG_RE.search(result.stderr)
 
 
 class TestStreamingTemplates:
     """Test against actual streaming templates if available."""
 
-    def test_streaming_templates_exist(self):
+    def test_streaming_templates_exist(self, streaming_kits):
         """Check if streaming templates are available."""
-        templates_dir = repo_root / "templates" / "apps" / "streaming_configs"
+        if streaming_kits is None:
+            pytest.skip("Streaming templates directory not found")
 
-        if templates_dir.exists():
-            streaming_files = list(templates_dir.glob("*.kit"))
-            print(f"\nFound {len(streaming_files)} streaming template(s):")
-            for f in streaming_files:
-                print(f"  - {f.name}")
+        print(f"\nFound {len(streaming_kits)} streaming template(s):")
+        for f in streaming_kits:
+            print(f"  - {f.name}")
 
-            # At minimum, we should have templates defined
-            assert len(streaming_files) > 0, "No streaming templates found"
-        else:
-            pytest.skip("Streaming templates directory not found")
+        # At minimum, we should have templates defined
+        assert len(streaming_kits) > 0, "No streaming templates found"
 
     def test_template_list_command(self):
         """Verify template list command works."""
@@ -85,7 +86,7 @@ class TestStreamingTemplates:
             ["./repo.sh", "template", "list"],
             capture_output=True,
             text=True,
-            cwd=repo_root,
+            cwd=repo_root_str,
             timeout=30
         )
 
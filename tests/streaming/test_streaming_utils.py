@@ -6,6 +6,7 @@ Tests detection, configuration, and management of Kit App Streaming
 using the REAL streaming extensions (not hallucinated ones).
 """
 
+import os
 import pytest
 from pathlib import Path
 import sys
@@ -13,117 +14,128 @@ import sys
 # Add tools to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'tools' / 'repoman'))
 
-from streaming_utils import (
-    is_streaming_app,
-    get_streaming_type,
-    get_streaming_url,
-    get_streaming_config_path,
-    STREAMING_EXTENSIONS
-)
+
+@pytest.fixture(scope="session")
+def streaming():
+    """
+    Import streaming_utils on first use rather than at collection time.
+
+    Constants are read through this fixture as well, since importing any name
+    from the module would load it (and its TOML backend) during collection.
+    """
+    import streaming_utils
+    return streaming_utils
 
 
 class TestStreamingExtensions:
     """Test streaming extension constants."""
 
-    def test_streaming_extensions_correct(self):
+    def test_streaming_extensions_correct(self, streaming):
         """Verify we're using the REAL streaming extensions."""
         # The REAL extensions that actually exist:
-        assert 'default' in STREAMING_EXTENSIONS
-        assert STREAMING_EXTENSIONS['default'] == 'omni.kit.livestream.app'
+        assert 'default' in streaming.STREAMING_EXTENSIONS
+        assert streaming.STREAMING_EXTENSIONS['default'] == 'omni.kit.livestream.app'
         
-        assert 'nvcf' in STREAMING_EXTENSIONS
-        assert STREAMING_EXTENSIONS['nvcf'] == 'omni.services.livestream.session'
+        assert 'nvcf' in streaming.STREAMING_EXTENSIONS
+        assert streaming.STREAMING_EXTENSIONS['nvcf'] == 'omni.services.livestream.session'
         
-        assert 'gdn' in STREAMING_EXTENSIONS
-        assert STREAMING_EXTENSIONS['gdn'] == 'omni.kit.gfn'
+        assert 'gdn' in streaming.STREAMING_EXTENSIONS
+        assert streaming.STREAMING_EXTENSIONS['gdn'] == 'omni.kit.gfn'
         
         # Verify hallucinated extensions are NOT in our list
-        for ext_type, ext_name in STREAMING_EXTENSIONS.items():
+        for ext_type, ext_name in streaming.STREAMING_EXTENSIONS.items():
             assert 'omni.services.streaming.webrtc' != ext_name, \
                 "Hallucinated extension detected!"
             assert 'omni.kit.streamhelper' != ext_name, \
                 "Hallucinated extension detected!"
 
 
-class TestStreamingDetection:
-    """Test streaming app detection."""
+# .kit fixture contents, built once at import time and written as raw bytes
+_KIT_HEADER = b"[package]\ntitle = 'Test App'\n\n[dependencies]\n"
+_KIT_FILES = {
+    'default.kit': _KIT_HEADER + b'"omni.kit.livestream.app" = {}\n',
+    'nvcf.kit': _KIT_HEADER + b'"omni.services.livestream.session" = {}\n"omni.ujitso.client" = {}\n',
+    'gdn.kit': _KIT_HEADER + b'"omni.kit.gfn" = {}\n',
+    'regular.kit': _KIT_HEADER + b'"omni.kit.window.viewport" = {}\n',
+    'template.kit': b"[package]\ntemplate_name = 'My_Streaming_App'\n\n[dependencies]\n",
+    'empty.kit': b'',
+}
 
-    def test_detect_default_streaming(self, tmp_path):
-        """Test detection of default streaming apps."""
-        kit_file = tmp_path / "test.kit"
-        kit_file.write_text("""
-[package]
-title = "Test App"
 
-[dependencies]
-"omni.kit.livestream.app" = {}
-""")
-        
-        assert is_streaming_app(kit_file) is True
-        assert get_streaming_type(kit_file) == 'default'
-
-    def test_detect_nvcf_streaming(self, tmp_path):
-        """Test detection of NVCF streaming apps."""
-        kit_file = tmp_path / "test_nvcf.kit"
-        kit_file.write_text("""
-[package]
-title = "Test NVCF App"
-
-[dependencies]
-"omni.services.livestream.session" = {}
-"omni.ujitso.client" = {}
-""")
-        
-        assert is_streaming_app(kit_file) is True
-        assert get_streaming_type(kit_file) == 'nvcf'
-
-    def test_detect_gdn_streaming(self, tmp_path):
-        """Test detection of GDN streaming apps."""
-        kit_file = tmp_path / "test_gdn.kit"
-        kit_file.write_text("""
-[package]
-title = "Test GDN App"
-
-[dependencies]
-"omni.kit.gfn" = {}
-""")
-        
-        assert is_streaming_app(kit_file) is True
-        assert get_streaming_type(kit_file) == 'gdn'
-
-    def test_detect_non_streaming(self, tmp_path):
-        """Test detection of non-streaming apps."""
-        kit_file = tmp_path / "test_regular.kit"
-        kit_file.write_text("""
-[package]
-title = "Regular App"
-
-[dependencies]
-"omni.kit.window.viewport" = {}
-""")
-        
-        assert is_streaming_app(kit_file) is False
-        assert get_streaming_type(kit_file) is None
+@pytest.fixture(scope="session")
+def streaming_kit_files(tmp_path_factory):
+    """Write every detection .kit fixture once per session and return the directory."""
+    root = tmp_path_factory.mktemp("kits")
+    for name, content in _KIT_FILES.items():
+        (root / name).write_bytes(content)
+    return root
+
+
+class TestStreamingDetection:
+    """Test streaming app detection."""
 
-    def test_nonexistent_file(self, tmp_path):
+    @pytest.mark.parametrize("kit_name,expected_is,expected_type", [
+        ('default.kit', True, 'default'),
+        ('nvcf.kit', True, 'nvcf'),
+        ('gdn.kit', True, 'gdn'),
+        ('regular.kit', False, None),
+        ('template.kit', True, 'default'),
+        ('empty.kit', False, None),
+    ], ids=['default', 'nvcf', 'gdn', 'non_streaming', 'template_name', 'empty'])
+    def test_detect(self, streaming, streaming_kit_files, kit_name, expected_is, expected_type):
+        """Test detection of each streaming type (and non-streaming apps)."""
+        kit_file = streaming_kit_files / kit_name
+
+        assert streaming.is_streaming_app(kit_file) is expected_is
+        assert streaming.get_streaming_type(kit_file) == expected_type
+
+    def test_nonexistent_file(self, streaming, streaming_kit_files):
         """Test handling of nonexistent files."""
-        kit_file = tmp_path / "nonexistent.kit"
+        kit_file = streaming_kit_files / "nonexistent.kit"
         
-        assert is_streaming_app(kit_file) is False
-        assert get_streaming_type(kit_file) is None
+        assert streaming.is_streaming_app(kit_file) is False
+        assert streaming.get_streaming_type(kit_file) is None
+
+    def test_detection_follows_file_changes(self, streaming, tmp_path):
+        """Cached results must not survive an edit to the .kit file."""
+        kit_file = tmp_path / "changing.kit"
+        kit_file.write_bytes(_KIT_FILES['regular.kit'])
+        assert streaming.is_streaming_app(kit_file) is False
+
+        kit_file.write_bytes(_KIT_FILES['gdn.kit'])
+        assert streaming.is_streaming_app(kit_file) is True
+        assert streaming.get_streaming_type(kit_file) == 'gdn'
+
+
+class TestFlagGeneration:
+    """Test Kit command-line flags for streaming mode."""
+
+    def test_streaming_flags(self, streaming, monkeypatch):
+        """Streaming flags should run Kit headless and export the port."""
+        # get_streaming_flags writes os.environ directly; registering the
+        # variable with monkeypatch first restores it after the test
+        monkeypatch.setenv('LIVESTREAM_PORT', '0')
+        flags = streaming.get_streaming_flags(port=48000)
+
+        # Returned as a list so callers can prepend it to extra args
+        assert isinstance(flags, list)
+        flag_set = frozenset(flags)
+        assert '--no-window' in flag_set
+        assert '--/app/window/enabled=false' in flag_set
+        assert os.environ['LIVESTREAM_PORT'] == '48000'
 
 
 class TestStreamingURL:
     """Test streaming URL construction."""
 
-    def test_default_url(self):
+    def test_default_url(self, streaming):
         """Test default URL construction."""
-        url = get_streaming_url()
+        url = streaming.get_streaming_url()
         assert url == 'http://localhost:47995/streaming/webrtc-client'
 
-    def test_custom_url(self):
+    def test_custom_url(self, streaming):
         """Test custom URL construction."""
-        url = get_streaming_url(
+        url = streaming.get_streaming_url(
             port=8080,
             hostname='example.com',
             protocol='https'
@@ -134,45 +146,27 @@ class TestStreamingURL:
 class TestStreamingConfigPaths:
     """Test streaming configuration path utilities."""
 
-    def test_default_config_path(self):
+    def test_default_config_path(self, streaming):
         """Test default streaming config path."""
-        path = get_streaming_config_path('default')
+        path = streaming.get_streaming_config_path('default')
         assert 'default_stream.kit' in path
         assert 'templates/apps/streaming_configs' in path
 
-    def test_nvcf_config_path(self):
+    def test_nvcf_config_path(self, streaming):
         """Test NVCF streaming config path."""
-        path = get_streaming_config_path('nvcf')
+        path = streaming.get_streaming_config_path('nvcf')
         assert 'nvcf_stream.kit' in path
 
-    def test_gdn_config_path(self):
+    def test_gdn_config_path(self, streaming):
         """Test GDN streaming config path."""
-        path = get_streaming_config_path('gdn')
+        path = streaming.get_streaming_config_path('gdn')
         assert 'gdn_stream.kit' in path
 
 
 class TestHallucinationPrevention:
     """Tests to prevent hallucinated extensions from creeping back in."""
 
-    def test_no_webrtc_hallucination(self):
-        """Ensure omni.services.streaming.webrtc is not used."""
-        # This extension DOES NOT EXIST
-        hallucinated_ext = 'omni.services.streaming.webrtc'
-        
-        for ext_name in STREAMING_EXTENSIONS.values():
-            assert ext_name != hallucinated_ext, \
-                f"Hallucinated extension '{hallucinated_ext}' found in STREAMING_EXTENSIONS!"
-
-    def test_no_streamhelper_hallucination(self):
-        """Ensure omni.kit.streamhelper is not used."""
-        # This extension DOES NOT EXIST
-        hallucinated_ext = 'omni.kit.streamhelper'
-        
-        for ext_name in STREAMING_EXTENSIONS.values():
-            assert ext_name != hallucinated_ext, \
-                f"Hallucinated extension '{hallucinated_ext}' found in STREAMING_EXTENSIONS!"
-
-    def test_only_real_extensions(self):
+    def test_extensions_are_exactly_real_set(self, streaming):
         """Verify we only use extensions that actually exist."""
         # The ONLY real streaming extensions are:
         real_extensions = {
@@ -180,10 +174,17 @@ class TestHallucinationPrevention:
             'omni.services.livestream.session',  # NVCF
             'omni.kit.gfn',                      # GDN
         }
-        
-        for ext_name in STREAMING_EXTENSIONS.values():
-            assert ext_name in real_extensions, \
-                f"Extension '{ext_name}' is not a known real extension!"
+        # These extensions DO NOT EXIST
+        hallucinated_extensions = {
+            'omni.services.streaming.webrtc',
+            'omni.kit.streamhelper',
+        }
+
+        actual = set(streaming.STREAMING_EXTENSIONS.values())
+        assert actual == real_extensions, \
+            f"Unknown extensions in STREAMING_EXTENSIONS: {actual - real_extensions}"
+        assert actual.isdisjoint(hallucinated_extensions), \
+            f"Hallucinated extensions found in STREAMING_EXTENSIONS: {actual & hallucinated_extensions}"
 
 
 if __name__ == '__main__':
@@ -7,26 +7,32 @@ Commands:
   - estimate: print estimated size/time
   - prefetch: delegate to validate_kit_deps.py --prefetch
 
-This CLI intentionally shells to existing script(s) to minimize churn.
+validate/prefetch call validate_kit_deps.main() in-process to avoid a second
+interpreter start-up, falling back to a subprocess if it cannot be imported.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
 import subprocess
 import sys
 from pathlib import Path
+from typing import List
 
 # Local defaults (kept in sync with backend/config.py)
 ESTIMATED_SIZE_BYTES: int = 12 * 1024 * 1024 * 1024
 DEFAULT_BANDWIDTH_MBPS: float = 50.0
 
+# Derived constants for estimate_cmd
+_BPS_PER_MBPS: float = (1024 * 1024) / 8
+_ESTIMATED_GB: float = ESTIMATED_SIZE_BYTES / (1024**3)
+
 
 def estimate_cmd(args: argparse.Namespace) -> int:
     bw = float(args.bandwidth or DEFAULT_BANDWIDTH_MBPS)
-    bytes_per_second = (bw * 1024 * 1024) / 8
-    seconds = int(ESTIMATED_SIZE_BYTES / bytes_per_second)
+    seconds = int(ESTIMATED_SIZE_BYTES / (bw * _BPS_PER_MBPS))
     if args.json:
         print(
             json.dumps(
@@ -38,37 +44,56 @@ def estimate_cmd(args: argparse.Namespace) -> int:
             )
         )
     else:
-        print(f"Estimated size: {ESTIMATED_SIZE_BYTES / (1024**3):.1f} GB")
+        print(f"Estimated size: {_ESTIMATED_GB:.1f} GB")
         print(f"Bandwidth:      {bw:.0f} Mbps")
         mins = seconds // 60
         print(f"Estimated time: ~{mins} minutes")
     return 0
 
 
-def validate_cmd(args: argparse.Namespace) -> int:
+def _run_validate_kit_deps(argv: List[str]) -> int:
+    """Run validate_kit_deps.py with argv from the repo root and return its exit code."""
     repo_root = Path(__file__).resolve().parents[2]
-    script = repo_root / "tools" / "repoman" / "validate_kit_deps.py"
-    cmd = [sys.executable, str(script)]
+    tools_dir = str(repo_root / "tools" / "repoman")
+    if tools_dir not in sys.path:
+        sys.path.insert(0, tools_dir)
+
+    try:
+        import validate_kit_deps
+    except ImportError:
+        script = repo_root / "tools" / "repoman" / "validate_kit_deps.py"
+        return subprocess.call([sys.executable, str(script), *argv], cwd=repo_root)
+
+    original_dir = os.getcwd()
+    os.chdir(repo_root)
+    try:
+        validate_kit_deps.main(argv)
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        print(e.code, file=sys.stderr)
+        return 1
+    finally:
+        os.chdir(original_dir)
+    return 0
+
+
+def validate_cmd(args: argparse.Namespace) -> int:
+    argv = []
     if args.check_registry:
-        cmd.append("--check-registry")
+        argv.append("--check-registry")
     if args.verbose:
-        cmd.append("-v")
-    return subprocess.call(cmd, cwd=repo_root)
+        argv.append("-v")
+    return _run_validate_kit_deps(argv)
 
 
 def prefetch_cmd(args: argparse.Namespace) -> int:
-    repo_root = Path(__file__).resolve().parents[2]
-    script = repo_root / "tools" / "repoman" / "validate_kit_deps.py"
-    cmd = [
-        sys.executable,
-        str(script),
-        "--prefetch",
-    ]
+    argv = ["--prefetch"]
     if args.config:
-        cmd += ["--config", args.config]
+        argv += ["--config", args.config]
     if args.verbose:
-        cmd.append("-v")
-    return subprocess.call(cmd, cwd=repo_root)
+        argv.append("-v")
+    return _run_validate_kit_deps(argv)
 
 
 def main() -> int:
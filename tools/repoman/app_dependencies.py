@@ -12,9 +12,14 @@ Key Features:
 - Packman integration without core changes
 """
 
+import functools
+import os
+import platform as _plat
+import stat
 import sys
+import tempfile
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Iterator, Optional, Tuple
 
 # Handle TOML imports (Python 3.11+ has built-in tomllib)
 try:
@@ -31,11 +36,21 @@ except ImportError:
     HAS_TOMLI_W = False
     HAS_TOML = True
 
+# Process umask, read once at import (os.umask can only be read by setting
+# it); write_toml applies it to newly created config files
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
 
 def load_toml(file_path: Path) -> Dict[str, Any]:
     """
     Load TOML configuration file.
 
+    Parsed results are cached per process, keyed on the file's mtime, size
+    and inode (write_toml replaces files by rename), so repeated lookups of
+    an unchanged file skip the read and parse. The returned dictionary is
+    shared between callers and must not be mutated.
+
     Args:
         file_path: Path to TOML file
 
@@ -46,15 +61,23 @@ def load_toml(file_path: Path) -> Dict[str, Any]:
         FileNotFoundError: If file doesn't exist
         Exception: If TOML parsing fails
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"Configuration file not found: {file_path}")
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Configuration file not found: {file_path}") from None
+
+    return _load_toml_cached(os.fspath(file_path), st.st_mtime_ns, st.st_size, st.st_ino)
+
 
+@functools.lru_cache(maxsize=256)
+def _load_toml_cached(path_str: str, mtime_ns: int, size: int, ino: int) -> Dict[str, Any]:
+    """Parse a TOML file; memoized by load_toml on (path, mtime, size, inode)."""
     if HAS_TOMLLIB:
-        with open(file_path, 'rb') as f:
+        with open(path_str, 'rb') as f:
             return tomllib.load(f)
     elif HAS_TOML:
         import toml as toml_lib
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(path_str, 'r', encoding='utf-8') as f:
             return toml_lib.load(f)
     else:
         raise RuntimeError("No TOML library available")
@@ -64,22 +87,49 @@ def write_toml(file_path: Path, data: Dict[str, Any]) -> None:
     """
     Write TOML configuration file.
 
+    The file is left untouched if it already holds identical content, so its
+    mtime (and the load_toml cache entry) stays valid. Otherwise the content
+    is written to a uniquely named temporary sibling, given the existing
+    file's mode, and moved into place atomically.
+
     Args:
         file_path: Path to write TOML file
         data: Dictionary to write as TOML
     """
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-
     if HAS_TOMLI_W:
-        with open(file_path, 'wb') as f:
-            tomli_w.dump(data, f)
+        content = tomli_w.dumps(data).encode('utf-8')
     elif HAS_TOML:
         import toml as toml_lib
-        with open(file_path, 'w', encoding='utf-8') as f:
-            toml_lib.dump(data, f)
+        content = toml_lib.dumps(data).encode('utf-8')
     else:
         raise RuntimeError("No TOML writing library available")
 
+    try:
+        with open(file_path, 'rb') as f:
+            if f.read() == content:
+                return
+            mode = stat.S_IMODE(os.fstat(f.fileno()).st_mode)
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        mode = 0o666 & ~_UMASK
+
+    # A unique temporary name per writer, so concurrent writers of the same
+    # file don't share one; mkstemp creates it 0600, so restore the mode
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{file_path.name}.", suffix=".tmp", dir=file_path.parent
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+
 
 def should_use_per_app_deps(app_path: Path) -> bool:
     """
@@ -94,13 +144,15 @@ def should_use_per_app_deps(app_path: Path) -> bool:
     Returns:
         True if app should use per-app dependencies, False otherwise
     """
-    if not app_path or not app_path.exists():
+    if not app_path:
         return False
 
-    deps_dir = app_path / "dependencies"
-    deps_config = deps_dir / "kit-deps.toml"
-
-    return deps_dir.exists() and deps_config.exists()
+    # A single stat of the config file also proves both parent directories exist
+    try:
+        os.stat(os.path.join(app_path, "dependencies", "kit-deps.toml"))
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return True
 
 
 def get_app_deps_config(app_path: Path) -> Optional[Dict[str, Any]]:
@@ -139,12 +191,21 @@ def get_app_kit_path(app_path: Path) -> Path:
     return app_path / "_kit"
 
 
+# Host platform never changes within a process
+_SYSTEM = _plat.system().lower()
+_IS_WINDOWS = _SYSTEM == 'windows'
+
+
 def get_app_kit_executable(
     app_path: Path, platform: str = None
 ) -> Optional[Path]:
     """
     Find the Kit executable for a specific application.
 
+    Lookups are cached on the mtime of the app's _kit/kit/ directory, so the
+    existence probes only rerun after the SDK is (re)installed. Use
+    clear_kit_executable_cache() to drop cached results.
+
     Args:
         app_path: Path to application directory
         platform: Platform identifier (e.g., 'linux-x86_64').
@@ -153,32 +214,41 @@ def get_app_kit_executable(
     Returns:
         Path to Kit executable if it exists, None otherwise
     """
-    if platform is None:
-        import platform as plat
-        system = plat.system().lower()
-        if system == 'windows':
-            platform = 'windows-x86_64'
-        elif system == 'linux':
-            platform = 'linux-x86_64'
-        else:
-            platform = f'{system}-x86_64'
+    is_windows = _IS_WINDOWS if platform is None else 'windows' in platform.lower()
 
     # Check per-app Kit SDK
-    app_kit_path = get_app_kit_path(app_path)
-    kit_exe = app_kit_path / "kit" / "kit"
+    kit_dir = get_app_kit_path(app_path) / "kit"
+    try:
+        mtime_ns = os.stat(kit_dir).st_mtime_ns
+    except (FileNotFoundError, NotADirectoryError):
+        return None
 
+    return _find_kit_exe(os.fspath(kit_dir), is_windows, mtime_ns)
+
+
+@functools.lru_cache(maxsize=256)
+def _find_kit_exe(
+    kit_dir: str, is_windows: bool, mtime_ns: int
+) -> Optional[Path]:
+    """Probe kit_dir for the Kit executable; memoized by get_app_kit_executable."""
+    kit_exe = Path(kit_dir, "kit")
     if kit_exe.exists():
         return kit_exe
 
     # On Windows, check for .exe extension
-    if 'windows' in platform.lower():
-        kit_exe_win = app_kit_path / "kit" / "kit.exe"
+    if is_windows:
+        kit_exe_win = Path(kit_dir, "kit.exe")
         if kit_exe_win.exists():
             return kit_exe_win
 
     return None
 
 
+def clear_kit_executable_cache() -> None:
+    """Drop the Kit executable lookups cached by get_app_kit_executable."""
+    _find_kit_exe.cache_clear()
+
+
 def get_repo_config() -> Optional[Dict[str, Any]]:
     """
     Load repository configuration from repo.toml.
@@ -261,7 +331,9 @@ def create_default_deps_config(
             "version": kit_version
         },
         "cache": {
-            "strategy": "isolated"
+            # Share packman's package cache across apps; "isolated" gives
+            # the app its own cache under _kit/cache
+            "strategy": "shared"
         },
         "dependencies": {}
     }
@@ -305,6 +377,21 @@ def initialize_per_app_deps(
         return False
 
 
+# Cache strategies accepted in kit-deps.toml [cache] strategy
+_CACHE_STRATEGIES = frozenset(('isolated', 'shared'))
+
+# Required fields as (key path, missing message, validator, invalid message),
+# checked in order; each path's parents are validated by earlier entries
+_REQUIRED_FIELDS = (
+    (('kit_sdk',), "Missing required 'kit_sdk' section",
+     lambda value: isinstance(value, dict),
+     "'kit_sdk' must be a dictionary"),
+    (('kit_sdk', 'version'), "Missing required 'kit_sdk.version'",
+     lambda value: isinstance(value, str) and bool(value.strip()),
+     "'kit_sdk.version' must be a non-empty string"),
+)
+
+
 def validate_deps_config(
     config: Dict[str, Any]
 ) -> Tuple[bool, Optional[str]]:
@@ -320,31 +407,23 @@ def validate_deps_config(
     if not isinstance(config, dict):
         return False, "Configuration must be a dictionary"
 
-    # Check for required kit_sdk section
-    if 'kit_sdk' not in config:
-        return False, "Missing required 'kit_sdk' section"
-
-    kit_sdk = config['kit_sdk']
-    if not isinstance(kit_sdk, dict):
-        return False, "'kit_sdk' must be a dictionary"
-
-    # Check for required version
-    if 'version' not in kit_sdk:
-        return False, "Missing required 'kit_sdk.version'"
-
-    version = kit_sdk['version']
-    if not isinstance(version, str) or not version.strip():
-        return False, "'kit_sdk.version' must be a non-empty string"
+    for path, missing_msg, is_valid, invalid_msg in _REQUIRED_FIELDS:
+        node = config
+        for key in path[:-1]:
+            node = node[key]
+        if path[-1] not in node:
+            return False, missing_msg
+        if not is_valid(node[path[-1]]):
+            return False, invalid_msg
 
     # Validate cache strategy if present
-    if 'cache' in config:
-        cache = config['cache']
-        if isinstance(cache, dict) and 'strategy' in cache:
-            strategy = cache['strategy']
-            if strategy not in ['isolated', 'shared']:
-                msg = (f"Invalid cache strategy '{strategy}'. "
-                       f"Must be 'isolated' or 'shared'")
-                return False, msg
+    cache = config.get('cache')
+    if isinstance(cache, dict) and 'strategy' in cache:
+        strategy = cache['strategy']
+        if not isinstance(strategy, str) or strategy not in _CACHE_STRATEGIES:
+            msg = (f"Invalid cache strategy '{strategy}'. "
+                   f"Must be 'isolated' or 'shared'")
+            return False, msg
 
     return True, None
 
@@ -376,23 +455,49 @@ def get_app_path_from_name(repo_root: Path, app_name: str) -> Path:
     return repo_root / "source" / "apps" / app_name
 
 
-def list_apps_with_per_app_deps(repo_root: Path) -> list[Path]:
+# Above this many app directories, config probes are spread over a thread pool
+_PARALLEL_STAT_THRESHOLD = 4
+_STAT_WORKERS = 8
+
+
+def _has_deps_config(app_dir: str) -> bool:
+    """Return True if app_dir contains dependencies/kit-deps.toml."""
+    return os.path.isfile(os.path.join(app_dir, "dependencies", "kit-deps.toml"))
+
+
+def list_apps_with_per_app_deps(repo_root: Path) -> Iterator[Path]:
     """
     List all applications that use per-app dependencies.
 
+    Makes a single os.scandir pass over source/apps (directory checks use the
+    cached entry type and follow symlinked app directories), then probes
+    each app's kit-deps.toml. With more than a handful of apps the probes run
+    on a thread pool, which hides stat latency on network filesystems;
+    results keep directory order.
+
     Args:
         repo_root: Repository root path
 
-    Returns:
-        List of paths to apps with per-app dependencies
+    Yields:
+        Paths to apps with per-app dependencies
     """
-    apps_dir = repo_root / "source" / "apps"
-    if not apps_dir.exists():
-        return []
-
-    apps_with_deps = []
-    for app_path in apps_dir.iterdir():
-        if app_path.is_dir() and should_use_per_app_deps(app_path):
-            apps_with_deps.append(app_path)
+    apps_dir = os.path.join(repo_root, "source", "apps")
+    try:
+        with os.scandir(apps_dir) as it:
+            app_dirs = [
+                entry.path for entry in it
+                if entry.is_dir()
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return
+
+    if len(app_dirs) <= _PARALLEL_STAT_THRESHOLD:
+        has_config = map(_has_deps_config, app_dirs)
+    else:
+        from concurrent.futures import ThreadPoolExecutor
+        with ThreadPoolExecutor(max_workers=_STAT_WORKERS) as pool:
+            has_config = list(pool.map(_has_deps_config, app_dirs))
 
-    return apps_with_deps
+    for app_dir, configured in zip(app_dirs, has_config):
+        if configured:
+            yield Path(app_dir)
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Filesystem helpers shared by the repoman tools.
+
+Fast file and tree copies (in-kernel copies, copy-on-write clones,
+hardlinks, thread-pool tree copies) and raw byte writes, used by the
+template dispatcher, the standalone generator and the per-app dependency
+puller.
+"""
+
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+# Linux ioctl request that makes a file share all extents of another
+# (reflink; btrfs, xfs, and other copy-on-write filesystems)
+_FICLONE = 0x40049409
+
+
+def copy_file(src, dst) -> None:
+    """
+    Copy a file's contents and metadata, keeping the data in the kernel.
+
+    Equivalent to ``shutil.copy2(src, dst)``. Tries os.copy_file_range
+    (Linux), then os.sendfile, and finishes with a buffered copy if neither
+    is available or the kernel refuses (e.g. EXDEV, ENOSYS). Each stage
+    continues from where the previous one stopped.
+    """
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        done = False
+        if hasattr(os, 'copy_file_range'):
+            try:
+                while os.copy_file_range(in_fd, out_fd, 1 << 20):
+                    pass
+                done = True
+            except OSError:
+                pass
+        if not done and hasattr(os, 'sendfile'):
+            try:
+                while os.sendfile(out_fd, in_fd, None, 1 << 20):
+                    pass
+                done = True
+            except OSError:
+                pass
+        if not done:
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    shutil.copystat(src, dst)
+
+
+def reflink(src, dst) -> bool:
+    """Clone a file copy-on-write with FICLONE; False if unsupported."""
+    try:
+        import fcntl
+    except ImportError:
+        return False
+    try:
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+    except OSError:
+        return False
+    shutil.copystat(src, dst)
+    return True
+
+
+def clonefile(src, dst) -> bool:
+    """Clone a file or directory tree with macOS clonefile(2) (APFS)."""
+    import ctypes
+    import ctypes.util
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        clonefile_fn = libc.clonefile
+    except (OSError, AttributeError):
+        return False
+    clonefile_fn.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_int]
+    clonefile_fn.restype = ctypes.c_int
+    return clonefile_fn(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+
+def clone_file(src, dst) -> None:
+    """Reflink a file where the filesystem allows it, else copy_file it."""
+    if not reflink(src, dst):
+        copy_file(src, dst)
+
+
+def link_file(src, dst) -> None:
+    """Hardlink a file, falling back to copy_file (e.g. across devices)."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        copy_file(src, dst)
+
+
+def copytree(src, dst, symlinks: bool = False, copy_function=copy_file,
+             max_workers: int = 8) -> None:
+    """
+    Copy a directory tree, copying files on a thread pool.
+
+    Follows ``shutil.copytree`` semantics: dst must not exist yet, symlinks
+    are followed unless ``symlinks`` is True (then they are recreated), and
+    directory metadata is copied. Directories are created while scanning
+    and files are copied concurrently with copy_function (default
+    copy_file). The first copy error is re-raised once all submitted copies
+    have finished.
+    """
+    dirs = []
+    futures = []
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        pending = [(os.fspath(src), os.fspath(dst))]
+        while pending:
+            src_dir, dst_dir = pending.pop()
+            os.makedirs(dst_dir)
+            dirs.append((src_dir, dst_dir))
+            with os.scandir(src_dir) as it:
+                for entry in it:
+                    target = os.path.join(dst_dir, entry.name)
+                    if symlinks and entry.is_symlink():
+                        os.symlink(os.readlink(entry.path), target)
+                    elif entry.is_dir():
+                        pending.append((entry.path, target))
+                    else:
+                        futures.append(pool.submit(copy_function, entry.path, target))
+    for future in futures:
+        future.result()
+
+    # Copy directory metadata last, since adding files updates mtimes
+    for src_dir, dst_dir in reversed(dirs):
+        shutil.copystat(src_dir, dst_dir)
+
+
+def write_bytes(path, data: bytes) -> None:
+    """Write bytes to a new or truncated file with raw os.open/os.write."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
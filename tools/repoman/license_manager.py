@@ -5,10 +5,11 @@ Prompts user to accept terms on first run and stores acceptance.
 """
 
 import os
+import re
 import sys
 import json
+import time
 from pathlib import Path
-from datetime import datetime
 from typing import Optional, Dict
 
 # License text
@@ -21,6 +22,10 @@ NVIDIA Software License Agreement: https://www.nvidia.com/en-us/agreements/enter
 Product-Specific Terms for NVIDIA Omniverse: https://www.nvidia.com/en-us/agreements/enterprise-software/product-specific-terms-for-omniverse/
 """
 
+# Matches an accepted record in the acceptance file without parsing the JSON
+_ACCEPTED_RE = re.compile(rb'"accepted"\s*:\s*true')
+
+
 class LicenseManager:
     """Manages license acceptance for Kit App Template."""
 
@@ -38,28 +43,51 @@ class LicenseManager:
 
         self.license_file = self.config_dir / "license_accepted.json"
 
-    def is_license_accepted(self) -> bool:
-        """Check if license has been accepted."""
-        if not self.license_file.exists():
-            return False
+        # (mtime_ns, size) of the acceptance file and its parsed contents
+        self._cached = None
+
+    def _load_acceptance(self) -> Optional[Dict]:
+        """Load the acceptance file, re-parsing only when it has changed."""
+        try:
+            st = os.stat(self.license_file)
+        except OSError:
+            self._cached = None
+            return None
+
+        signature = (st.st_mtime_ns, st.st_size)
+        if self._cached is not None and self._cached[0] == signature:
+            return self._cached[1]
 
         try:
             with open(self.license_file, 'r') as f:
                 data = json.load(f)
-                return data.get('accepted', False)
         except Exception:
+            data = None
+        self._cached = (signature, data)
+        return data
+
+    def is_license_accepted(self) -> bool:
+        """Check if license has been accepted."""
+        data = self._load_acceptance()
+        if not isinstance(data, dict):
             return False
+        return data.get('accepted', False)
 
-    def get_acceptance_info(self) -> Optional[Dict]:
-        """Get license acceptance information."""
-        if not self.license_file.exists():
-            return None
+    def is_license_accepted_fast(self) -> bool:
+        """
+        Check license acceptance by scanning the file head, without JSON parsing.
 
+        Used by the ``--check`` fast path where only the boolean is needed.
+        """
         try:
-            with open(self.license_file, 'r') as f:
-                return json.load(f)
-        except Exception:
-            return None
+            with open(self.license_file, 'rb') as f:
+                return _ACCEPTED_RE.search(f.read(256)) is not None
+        except OSError:
+            return False
+
+    def get_acceptance_info(self) -> Optional[Dict]:
+        """Get license acceptance information."""
+        return self._load_acceptance()
 
     def store_acceptance(self, accepted: bool = True) -> bool:
         """
@@ -78,12 +106,14 @@ class LicenseManager:
             # Store acceptance with timestamp
             data = {
                 'accepted': accepted,
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S'),  # local time, second precision
                 'version': '1.0',  # License version for future tracking
             }
 
             with open(self.license_file, 'w') as f:
-                json.dump(data, f, indent=2)
+                # Machine-read only; use --info --pretty to inspect
+                json.dump(data, f, separators=(',', ':'))
+            self._cached = None
 
             return True
         except Exception as e:
@@ -202,6 +232,11 @@ def main():
         action='store_true',
         help="Show license acceptance information"
     )
+    parser.add_argument(
+        '--pretty',
+        action='store_true',
+        help="With --info, print the raw acceptance record as indented JSON"
+    )
     parser.add_argument(
         '--config-dir',
         type=Path,
@@ -214,12 +249,14 @@ def main():
 
     if args.check:
         # Check mode - silent exit code
-        sys.exit(0 if manager.is_license_accepted() else 1)
+        sys.exit(0 if manager.is_license_accepted_fast() else 1)
 
     if args.info:
         # Show acceptance info
         info = manager.get_acceptance_info()
-        if info:
+        if info and args.pretty:
+            print(json.dumps(info, indent=2))
+        elif info:
             print("License Acceptance Information:")
             print(f"  Status: Accepted")
             print(f"  Date: {info.get('timestamp', 'Unknown')}")
@@ -5,9 +5,16 @@ Per-app dependency puller - handles pulling Kit SDK and dependencies to app-spec
 This module orchestrates packman to install dependencies to per-app _kit/ directories.
 """
 
+import hashlib
+import logging
 import os
+import re
 import sys
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Dict, Any
 
@@ -16,6 +23,7 @@ tools_path = Path(__file__).parent
 if str(tools_path) not in sys.path:
     sys.path.insert(0, str(tools_path))
 
+from fs_utils import clonefile, copytree
 from app_dependencies import (
     should_use_per_app_deps,
     get_app_deps_config,
@@ -23,21 +31,45 @@ from app_dependencies import (
     list_apps_with_per_app_deps
 )
 
+logger = logging.getLogger(__name__)
 
+# Host platform target (also used as the ABI) and packman launcher name
+_PLATFORM_TARGET = {
+    'win32': 'windows-x86_64',
+    'darwin': 'mac-x86_64',
+}.get(sys.platform, 'linux-x86_64')
+_PACKMAN_NAME = 'packman.cmd' if sys.platform == 'win32' else 'packman'
+
+# Per-app SDKs are always pulled in the release configuration
+_BUILD_CONFIG = 'release'
+
+# Generated packman XML, relative to the app directory
+_REL_XML = "dependencies/kit-sdk-app.packman.xml"
+
+# Records which SDK a successful packman pull installed into _kit/
+_PULL_STAMP_NAME = '.pull-stamp'
+
+# Serializes verbose packman output, so concurrent pulls print whole blocks
+_OUTPUT_LOCK = threading.Lock()
+
+# Rewrites applied to kit-sdk.packman.xml for a per-app Kit SDK
+_LINKPATH_RE = re.compile(r'linkPath="[^"]*"')
+_NAME_RE = re.compile(r'name="kit_sdk_\w+"')
+_VAR_RE = re.compile(r'\$\{(platform_target|platform_target_abi|config)\}')
+
+
+@lru_cache(maxsize=1)
 def get_repo_root() -> Path:
     """Get repository root path."""
     return Path(__file__).parent.parent.parent
 
 
+@lru_cache(maxsize=1)
 def get_packman_executable() -> Path:
     """Get path to packman executable."""
     repo_root = get_repo_root()
 
-    # Check for Windows
-    if sys.platform == 'win32':
-        packman = repo_root / "tools" / "packman" / "packman.cmd"
-    else:
-        packman = repo_root / "tools" / "packman" / "packman"
+    packman = repo_root / "tools" / "packman" / _PACKMAN_NAME
 
     if not packman.exists():
         raise FileNotFoundError(f"Packman not found at {packman}")
@@ -45,6 +77,7 @@ def get_packman_executable() -> Path:
     return packman
 
 
+@lru_cache(maxsize=1)
 def get_kit_sdk_xml_template() -> Path:
     """Get the template kit-sdk.packman.xml file."""
     repo_root = get_repo_root()
@@ -54,7 +87,45 @@ def get_kit_sdk_xml_template() -> Path:
     return template
 
 
-def generate_app_kit_xml(app_path: Path, config: Dict[str, Any]) -> Path:
+def _get_kit_sdk_xml_text() -> str:
+    """Read the kit-sdk.packman.xml template, re-reading it once it changes."""
+    template = get_kit_sdk_xml_template()
+    st = os.stat(template)
+    return _read_kit_sdk_xml(os.fspath(template), st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@lru_cache(maxsize=1)
+def _read_kit_sdk_xml(path_str: str, mtime_ns: int, size: int, ino: int) -> str:
+    return Path(path_str).read_text()
+
+
+def _render_app_kit_xml(app_path: Path) -> str:
+    """Return the packman XML for app_path's per-app Kit SDK."""
+    app_name = app_path.name
+
+    # Read the template kit-sdk.packman.xml
+    xml_content = _get_kit_sdk_xml_text()
+
+    # Resolve template variables in a single pass
+    variables = {
+        'platform_target': _PLATFORM_TARGET,
+        'platform_target_abi': _PLATFORM_TARGET,
+        'config': _BUILD_CONFIG,
+    }
+    xml_content = _VAR_RE.sub(lambda m: variables[m.group(1)], xml_content)
+
+    # Modify the linkPath to point to app-specific _kit directory
+    # After variable resolution, it will be something like:
+    # linkPath="../../_build/linux-x86_64/release/kit"
+    # We want: linkPath="_kit/kit"
+    xml_content = _LINKPATH_RE.sub('linkPath="_kit/kit"', xml_content)
+
+    # Update the dependency name to be app-specific
+    return _NAME_RE.sub(f'name="kit_sdk_app_{app_name}"', xml_content)
+
+
+def generate_app_kit_xml(app_path: Path, config: Dict[str, Any],
+                         xml_content: Optional[str] = None) -> Path:
     """
     Generate packman XML for app-specific Kit SDK.
 
@@ -64,61 +135,74 @@ def generate_app_kit_xml(app_path: Path, config: Dict[str, Any]) -> Path:
     Args:
         app_path: Path to application directory
         config: App dependency configuration
+        xml_content: Already rendered XML, to avoid rendering it twice
 
     Returns:
         Path to generated XML file
     """
-    app_name = app_path.name
+    if xml_content is None:
+        xml_content = _render_app_kit_xml(app_path)
 
-    # Determine platform and build config
-    if sys.platform == 'win32':
-        platform_target = 'windows-x86_64'
-        platform_target_abi = 'windows-x86_64'
-    elif sys.platform == 'darwin':
-        platform_target = 'mac-x86_64'
-        platform_target_abi = 'mac-x86_64'
-    else:
-        platform_target = 'linux-x86_64'
-        platform_target_abi = 'linux-x86_64'
+    # Write to app dependencies dir, leaving the file (and its mtime)
+    # untouched when the content has not changed
+    xml_file = app_path / _REL_XML
+    xml_file.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        existing = xml_file.read_text()
+    except FileNotFoundError:
+        existing = None
+    if existing != xml_content:
+        xml_file.write_text(xml_content)
 
-    build_config = 'release'  # Default to release
+    return xml_file
 
-    # Read the template kit-sdk.packman.xml
-    template_file = get_kit_sdk_xml_template()
-    xml_content = template_file.read_text()
 
-    # Resolve template variables
-    xml_content = xml_content.replace('${platform_target}', platform_target)
-    xml_content = xml_content.replace('${platform_target_abi}', platform_target_abi)
-    xml_content = xml_content.replace('${config}', build_config)
+def _fast_clone(src: Path, dst: Path) -> str:
+    """
+    Clone the src tree to dst as cheaply as the platform allows.
 
-    # Modify the linkPath to point to app-specific _kit directory
-    # After variable resolution, it will be something like:
-    # linkPath="../../_build/linux-x86_64/release/kit"
-    # We want: linkPath="_kit/kit"
-    import re
-    xml_content = re.sub(
-        r'linkPath="[^"]*"',
-        'linkPath="_kit/kit"',
-        xml_content
-    )
+    Tries, in order: clonefile on macOS, ``cp -a --reflink=always`` on Linux
+    (copy-on-write on btrfs/xfs; it fails on other filesystems rather than
+    falling back to a full copy), a hardlink farm, and finally a regular
+    copy spread over a thread pool. Symlinks inside the tree are preserved;
+    a symlink at src itself is followed, as with shutil.copytree. Note that
+    hardlinked files share their inode with the global SDK.
 
-    # Update the dependency name to be app-specific
-    xml_content = re.sub(
-        r'name="kit_sdk_\w+"',
-        f'name="kit_sdk_app_{app_name}"',
-        xml_content
-    )
+    Returns:
+        Name of the method that produced dst
+    """
+    import shutil
 
-    # Write to app dependencies dir
-    deps_dir = app_path / "dependencies"
-    xml_file = deps_dir / "kit-sdk-app.packman.xml"
-    xml_file.write_text(xml_content)
+    src_real = os.path.realpath(src)
 
-    return xml_file
+    if sys.platform == 'darwin' and clonefile(src_real, os.fspath(dst)):
+        return "clonefile"
+
+    if sys.platform.startswith('linux'):
+        try:
+            result = subprocess.run(
+                ["cp", "-a", "--reflink=always", src_real, os.fspath(dst)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
+            )
+            if result.returncode == 0:
+                return "reflink"
+        except OSError:
+            pass
+        shutil.rmtree(dst, ignore_errors=True)
+
+    try:
+        shutil.copytree(src_real, dst, symlinks=True, copy_function=os.link)
+        return "hardlink"
+    except (OSError, shutil.Error):
+        # e.g. EXDEV when src and dst are on different filesystems
+        shutil.rmtree(dst, ignore_errors=True)
+
+    copytree(src_real, dst, symlinks=True)
+    return "copy"
 
 
-def copy_global_kit_to_app(app_path: Path, verbose: bool = False) -> bool:
+def copy_global_kit_to_app(app_path: Path) -> bool:
     """
     Copy global Kit SDK to app-specific location.
 
@@ -127,7 +211,6 @@ def copy_global_kit_to_app(app_path: Path, verbose: bool = False) -> bool:
 
     Args:
         app_path: Path to application directory
-        verbose: Print verbose output
 
     Returns:
         True if successful, False otherwise
@@ -137,157 +220,229 @@ def copy_global_kit_to_app(app_path: Path, verbose: bool = False) -> bool:
     repo_root = get_repo_root()
 
     # Find global Kit SDK
-    if sys.platform == 'win32':
-        platform = 'windows-x86_64'
-    elif sys.platform == 'darwin':
-        platform = 'mac-x86_64'
-    else:
-        platform = 'linux-x86_64'
-
-    global_kit = repo_root / "_build" / platform / "release" / "kit"
+    global_kit = repo_root / "_build" / _PLATFORM_TARGET / "release" / "kit"
 
     if not global_kit.exists():
-        if verbose:
-            print(f"  Global Kit SDK not found at {global_kit}")
+        logger.debug("  Global Kit SDK not found at %s", global_kit)
         return False
 
     # Copy to app-specific location
     app_kit = get_app_kit_path(app_path) / "kit"
     app_kit.parent.mkdir(parents=True, exist_ok=True)
 
-    if app_kit.exists():
-        if verbose:
-            print(f"  Removing existing app Kit SDK...")
-        shutil.rmtree(app_kit)
-
-    if verbose:
-        print(f"  Copying global Kit SDK to app-specific location...")
-        print(f"    From: {global_kit}")
-        print(f"    To: {app_kit}")
+    logger.debug("  Copying global Kit SDK to app-specific location...")
+    logger.debug("    From: %s", global_kit)
+    logger.debug("    To: %s", app_kit)
 
-    shutil.copytree(global_kit, app_kit, symlinks=True)
+    # Clone next to the existing SDK and swap it in with renames, so the
+    # app never sees a half-copied kit and a failed copy leaves it intact
+    tag = f"{os.getpid()}.{time.time_ns()}"
+    staging = app_kit.with_name(f"kit.new.{tag}")
+    try:
+        method = _fast_clone(global_kit, staging)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    if os.path.lexists(app_kit):
+        logger.debug("  Replacing existing app Kit SDK...")
+        stale = app_kit.with_name(f"kit.old.{tag}")
+        app_kit.rename(stale)
+        staging.rename(app_kit)
+        # Deleting thousands of files is slow; do it off the pull path.
+        # Not a daemon thread, so an exiting CLI still finishes cleanup
+        threading.Thread(target=_remove_stale_kits, args=(app_kit.parent,)).start()
+    else:
+        staging.rename(app_kit)
 
-    if verbose:
-        print(f"  ✓ Kit SDK copied successfully")
+    logger.debug("  ✓ Kit SDK copied successfully (%s)", method)
 
     return True
 
 
-def pull_app_dependencies(app_path: Path, verbose: bool = False, fallback_copy: bool = True) -> bool:
+def _remove_stale_kits(kit_root: Path) -> None:
+    """Delete SDK trees that copy_global_kit_to_app has swapped out."""
+    import shutil
+
+    for stale in kit_root.glob("kit.old.*"):
+        if stale.is_symlink():
+            # _kit/kit may be a packman link into the package cache
+            stale.unlink(missing_ok=True)
+        else:
+            shutil.rmtree(stale, ignore_errors=True)
+
+
+def _pull_stamp_key(xml_content: str) -> str:
+    """
+    Content key for a pull: a hash of the packman XML that drives it.
+
+    The XML pins the Kit SDK package version (from tools/deps), platform
+    and build config, so bumping the SDK pin invalidates every stamp.
+    """
+    return hashlib.sha256(xml_content.encode()).hexdigest()
+
+
+def pull_app_dependencies(app_path: Path, verbose: bool = False, fallback_copy: bool = True,
+                          force: bool = False) -> bool:
     """
     Pull dependencies for a specific app using packman.
 
+    Unless kit-deps.toml sets ``[cache] strategy = "isolated"``, packman uses
+    its shared package cache, so apps on the same Kit SDK version download
+    and extract it once. Isolated caches (under the app's _kit/cache) are
+    only worth it when apps need conflicting SDK builds.
+
     Args:
         app_path: Path to application directory
-        verbose: Print verbose output
+        verbose: Print packman's output, as one block once the pull ends
         fallback_copy: If True, copy global Kit SDK on packman failure
+        force: If True, pull even if the installed SDK is up to date
 
     Returns:
         True if successful, False otherwise
     """
-    if not should_use_per_app_deps(app_path):
-        if verbose:
-            print(f"App {app_path.name} does not use per-app dependencies")
-        return False
-
+    # get_app_deps_config already checks should_use_per_app_deps and reuses
+    # the parsed TOML while the file is unchanged; only re-check on a miss
+    # to tell an unconfigured app from a broken config
     config = get_app_deps_config(app_path)
     if not config:
-        print(f"Error: Could not load config for {app_path.name}", file=sys.stderr)
+        if not should_use_per_app_deps(app_path):
+            logger.debug("App %s does not use per-app dependencies", app_path.name)
+        else:
+            logger.error("Error: Could not load config for %s", app_path.name)
         return False
 
-    if verbose:
-        print(f"Pulling per-app dependencies for {app_path.name}...")
-        print(f"  Kit SDK version: {config['kit_sdk']['version']}")
+    # Render the app-specific packman XML; its content is what the pull
+    # installs, so it also keys the up-to-date check
+    try:
+        xml_content = _render_app_kit_xml(app_path)
+    except Exception as e:
+        logger.error("Error generating XML: %s", e)
+        return False
+
+    # Skip the pull if packman last installed from identical XML
+    kit_path = get_app_kit_path(app_path)
+    stamp_file = kit_path / _PULL_STAMP_NAME
+    stamp_key = _pull_stamp_key(xml_content)
+    if not force and (kit_path / "kit").is_dir():
+        try:
+            if stamp_file.read_text() == stamp_key:
+                logger.debug("Kit SDK for %s is up to date, skipping pull", app_path.name)
+                return True
+        except FileNotFoundError:
+            pass
+
+    logger.debug("Pulling per-app dependencies for %s...", app_path.name)
+    logger.debug("  Kit SDK version: %s", config['kit_sdk']['version'])
 
     # Get packman executable
     try:
         packman = get_packman_executable()
     except FileNotFoundError as e:
-        print(f"Error: {e}", file=sys.stderr)
+        logger.error("Error: %s", e)
         return False
 
-    # Generate app-specific packman XML
+    # Write app-specific packman XML
     try:
-        xml_file = generate_app_kit_xml(app_path, config)
-        if verbose:
-            print(f"  Generated XML: {xml_file}")
+        xml_file = generate_app_kit_xml(app_path, config, xml_content)
+        logger.debug("  Generated XML: %s", xml_file)
     except Exception as e:
-        print(f"Error generating XML: {e}", file=sys.stderr)
+        logger.error("Error generating XML: %s", e)
         return False
 
-    # Setup environment for per-app installation
-    env = os.environ.copy()
-    kit_path = get_app_kit_path(app_path)
+    # The child inherits this process's environment (env=None) unless the
+    # app needs its own packman cache
+    env = None
 
     # Set packman environment variables for app-specific cache
-    cache_strategy = config.get('cache', {}).get('strategy', 'isolated')
+    cache_strategy = config.get('cache', {}).get('strategy', 'shared')
     if cache_strategy == 'isolated':
         # Use app-specific cache
         app_cache = kit_path / "cache"
         app_cache.mkdir(parents=True, exist_ok=True)
-        env['PM_PACKAGES_ROOT'] = str(app_cache)
-        if verbose:
-            print(f"  Using isolated cache: {app_cache}")
+        env = {**os.environ, 'PM_PACKAGES_ROOT': str(app_cache)}
+        logger.debug("  Using isolated cache: %s", app_cache)
     else:
-        if verbose:
-            print(f"  Using shared cache")
+        logger.debug("  Using shared cache")
 
-    # Change to app directory for packman to resolve relative paths correctly
-    original_dir = Path.cwd()
-    os.chdir(app_path)
+    # Drop the stamp before pulling, so only a successful pull leaves one;
+    # after a failed pull (even one rescued by the fallback copy) the next
+    # run retries packman
+    try:
+        stamp_file.unlink(missing_ok=True)
+    except OSError as e:
+        logger.error("Error removing pull stamp: %s", e)
+        return False
 
     try:
         # Run packman pull
-        cmd = [str(packman), "pull", str(xml_file.relative_to(app_path))]
+        cmd = [str(packman), "pull", _REL_XML]
 
-        if verbose:
-            print(f"  Running: {' '.join(cmd)}")
-            print(f"  Working directory: {app_path}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("  Running: %s", ' '.join(cmd))
+            logger.debug("  Working directory: %s", app_path)
 
+        # Run from the app directory so packman resolves relative paths
+        # correctly; cwd= applies only to the child, not this process.
+        # When verbose, capture packman's combined output and print it in
+        # one block, so concurrent pulls don't interleave; when quiet,
+        # discard progress output and keep only stderr for diagnostics
+        if verbose:
+            output = {'stdout': subprocess.PIPE, 'stderr': subprocess.STDOUT}
+        else:
+            output = {'stdout': subprocess.DEVNULL, 'stderr': subprocess.PIPE}
         result = subprocess.run(
             cmd,
+            cwd=app_path,
             env=env,
-            capture_output=not verbose,
-            text=True
+            text=True,
+            **output
         )
 
+        if verbose and result.stdout:
+            with _OUTPUT_LOCK:
+                sys.stdout.write(f"[{app_path.name}] packman pull\n{result.stdout}")
+                sys.stdout.flush()
+
         if result.returncode != 0:
-            if verbose:
-                print(f"  Packman pull failed (may be due to unavailable package version)")
+            logger.debug("  Packman pull failed (may be due to unavailable package version)")
 
             if fallback_copy:
-                if verbose:
-                    print(f"  Attempting fallback: copying global Kit SDK...")
-                os.chdir(original_dir)  # Return to original dir for copy
-                if copy_global_kit_to_app(app_path, verbose=verbose):
+                logger.debug("  Attempting fallback: copying global Kit SDK...")
+                if copy_global_kit_to_app(app_path):
                     return True
                 else:
-                    if verbose:
-                        print(f"  Fallback copy also failed")
+                    logger.debug("  Fallback copy also failed")
 
-            print(f"Error pulling dependencies for {app_path.name}", file=sys.stderr)
+            if result.stderr:
+                logger.error("%s", result.stderr.rstrip())
+            logger.error("Error pulling dependencies for %s", app_path.name)
             return False
 
-        if verbose:
-            print(f"  ✓ Dependencies pulled successfully")
-            print(f"  Kit SDK installed to: {kit_path / 'kit'}")
+        if (kit_path / "kit").is_dir():
+            stamp_file.write_text(stamp_key)
+
+        logger.debug("  ✓ Dependencies pulled successfully")
+        logger.debug("  Kit SDK installed to: %s", kit_path / "kit")
 
         return True
 
     except Exception as e:
-        print(f"Error running packman: {e}", file=sys.stderr)
+        logger.error("Error running packman: %s", e)
         return False
-    finally:
-        os.chdir(original_dir)
 
 
-def pull_all_app_dependencies(repo_root: Optional[Path] = None, verbose: bool = False) -> int:
+def pull_all_app_dependencies(repo_root: Optional[Path] = None, verbose: bool = False,
+                              force: bool = False) -> int:
     """
     Pull dependencies for all apps that use per-app dependencies.
 
+    Apps are pulled concurrently in a thread pool.
+
     Args:
         repo_root: Repository root path (auto-detected if None)
-        verbose: Print verbose output
+        verbose: Print each app's packman output as one block
+        force: If True, pull even for apps whose SDK is up to date
 
     Returns:
         Number of apps successfully processed
@@ -295,26 +450,36 @@ def pull_all_app_dependencies(repo_root: Optional[Path] = None, verbose: bool =
     if repo_root is None:
         repo_root = get_repo_root()
 
-    apps = list_apps_with_per_app_deps(repo_root)
+    apps = list(list_apps_with_per_app_deps(repo_root))
 
     if not apps:
-        if verbose:
-            print("No apps with per-app dependencies found")
+        logger.debug("No apps with per-app dependencies found")
         return 0
 
-    if verbose:
-        print(f"Found {len(apps)} app(s) with per-app dependencies")
-        print()
+    logger.debug("Found %d app(s) with per-app dependencies", len(apps))
 
-    success_count = 0
-    for app_path in apps:
-        if pull_app_dependencies(app_path, verbose=verbose):
-            success_count += 1
-        if verbose:
-            print()
+    # Without packman every pull would fail; stop before doing per-app work
+    try:
+        get_packman_executable()
+    except FileNotFoundError as e:
+        logger.error("Error: %s", e)
+        return 0
 
-    if verbose:
-        print(f"Successfully pulled dependencies for {success_count}/{len(apps)} app(s)")
+    # Pulls are independent and mostly wait on packman (network + disk), so
+    # run them concurrently; pull_app_dependencies does not touch the
+    # process-wide cwd, so threads are safe
+    success_count = 0
+    max_workers = min(len(apps), (os.cpu_count() or 1) * 2)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = [
+            pool.submit(pull_app_dependencies, app_path, verbose=verbose, force=force)
+            for app_path in apps
+        ]
+        for future in as_completed(futures):
+            if future.result():
+                success_count += 1
+
+    logger.debug("Successfully pulled dependencies for %d/%d app(s)", success_count, len(apps))
 
     return success_count
 
@@ -335,6 +500,11 @@ def main():
         action="store_true",
         help="Pull dependencies for all apps with per-app deps"
     )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Pull even if the installed Kit SDK is up to date"
+    )
     parser.add_argument(
         "-v", "--verbose",
         action="store_true",
@@ -343,23 +513,30 @@ def main():
 
     args = parser.parse_args()
 
+    # Setup logging
+    log_level = logging.DEBUG if args.verbose else logging.INFO
+    logging.basicConfig(
+        level=log_level,
+        format='%(message)s'
+    )
+
     repo_root = get_repo_root()
 
     if args.app:
         # Pull for specific app
         app_path = repo_root / "source" / "apps" / args.app
         if not app_path.exists():
-            print(f"Error: App not found: {app_path}", file=sys.stderr)
+            logger.error("Error: App not found: %s", app_path)
             return 1
 
-        if pull_app_dependencies(app_path, verbose=args.verbose):
+        if pull_app_dependencies(app_path, verbose=args.verbose, force=args.force):
             return 0
         else:
             return 1
 
     elif args.all or not args.app:
         # Pull for all apps
-        success_count = pull_all_app_dependencies(repo_root, verbose=args.verbose)
+        success_count = pull_all_app_dependencies(repo_root, verbose=args.verbose, force=args.force)
         return 0 if success_count > 0 else 1
 
     else:
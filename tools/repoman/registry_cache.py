@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Registry Lookup Cache
+
+Disk-backed cache for extension registry queries, so repeated dependency
+validations don't re-query the same registry URLs. Entries live in a small
+SQLite database under ~/.omni/kit-app-template/ and expire after a TTL;
+misses (None results) are cached with a much shorter TTL so a registry
+outage or a typo isn't hammered on every run, but is re-checked soon.
+
+Usage:
+    from registry_cache import get_or_fetch
+
+    version = get_or_fetch(f"{url}|{name}", lambda: query(name, url))
+"""
+
+import functools
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".omni" / "kit-app-template" / "registry_cache.sqlite"
+
+# Seconds a found / not-found answer stays valid
+DEFAULT_TTL = 3600
+NEGATIVE_TTL = 60
+
+
+@functools.lru_cache(maxsize=4)
+def _connect(path_str: str, pid: int) -> sqlite3.Connection:
+    """Open (and create) the cache database; one connection per process."""
+    os.makedirs(os.path.dirname(path_str), exist_ok=True)
+    conn = sqlite3.connect(path_str, timeout=5, isolation_level=None)
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS entries "
+        "(key TEXT PRIMARY KEY, value TEXT, expires REAL)"
+    )
+    return conn
+
+
+def get_or_fetch(
+    key: str,
+    fetch_fn: Callable[[], Any],
+    ttl: float = DEFAULT_TTL,
+    negative_ttl: float = NEGATIVE_TTL,
+    refresh: bool = False,
+    cache_path: Optional[Path] = None
+) -> Any:
+    """
+    Return the cached value for key, calling fetch_fn on a miss.
+
+    Args:
+        key: Cache key (e.g. "<registry_url>|<extension_name>")
+        fetch_fn: Zero-argument callable producing a JSON-serializable value
+        ttl: Seconds to keep a non-None result
+        negative_ttl: Seconds to keep a None result
+        refresh: Ignore any cached entry and store a fresh result
+        cache_path: Database location (default: DEFAULT_CACHE_PATH)
+
+    Returns:
+        The cached or freshly fetched value
+
+    Cache errors (unwritable home, locked database) are logged and fall back
+    to calling fetch_fn directly.
+    """
+    try:
+        conn = _connect(str(cache_path or DEFAULT_CACHE_PATH), os.getpid())
+        if not refresh:
+            row = conn.execute(
+                "SELECT value, expires FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and row[1] > time.time():
+                return json.loads(row[0])
+    except (OSError, sqlite3.Error) as e:
+        logger.debug(f"Registry cache unavailable: {e}")
+        return fetch_fn()
+
+    value = fetch_fn()
+    expires = time.time() + (ttl if value is not None else negative_ttl)
+    try:
+        conn.execute(
+            "INSERT OR REPLACE INTO entries (key, value, expires) VALUES (?, ?, ?)",
+            (key, json.dumps(value), expires),
+        )
+    except sqlite3.Error as e:
+        logger.debug(f"Failed to update registry cache: {e}")
+    return value
@@ -4,28 +4,98 @@ OS-independent repo command dispatcher.
 Handles enhanced template functionality and delegates other commands to repoman.
 """
 
+import functools
+import json
 import os
+import re
+import subprocess
 import sys
-import shutil
+import stat
 import platform
 import logging
+from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+if __package__:
+    # Imported as tools.repoman.repo_dispatcher
+    from .fs_utils import copy_file, write_bytes
+else:
+    # Run as a script, or imported with tools/repoman already on sys.path
+    from fs_utils import copy_file, write_bytes
+
 logger = logging.getLogger(__name__)
 
+@functools.lru_cache(maxsize=1)
 def get_repo_root() -> Path:
-    """Get the repository root directory."""
+    """Get the repository root directory (cached for the process)."""
     # Find repo root by looking for repo.toml
-    current_dir = Path(__file__).parent
-    while current_dir.parent != current_dir:
-        if (current_dir / "repo.toml").exists():
-            return current_dir
-        current_dir = current_dir.parent
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        if os.path.isfile(os.path.join(current_dir, "repo.toml")):
+            return Path(current_dir)
+        parent_dir = os.path.dirname(current_dir)
+        if parent_dir == current_dir:
+            break
+        current_dir = parent_dir
 
     # Fallback: assume standard structure
     return Path(__file__).parent / ".." / ".."
 
+@functools.lru_cache(maxsize=None)
+def _dir_entries(path: str) -> frozenset:
+    """Names in a directory, listed with one scandir per process."""
+    try:
+        with os.scandir(path) as it:
+            return frozenset(entry.name for entry in it)
+    except OSError:
+        return frozenset()
+
+def _tool_exists(path: Path) -> bool:
+    """Check for a file under the repo's tools/ via the cached listing."""
+    return path.name in _dir_entries(str(path.parent))
+
+@functools.lru_cache(maxsize=None)
+def _repoman_script(repo_root: Path, name: str) -> str:
+    """Path string of a script in tools/repoman, built once per root and name."""
+    return os.fspath(repo_root / "tools" / "repoman" / name)
+
+def _load_toml_file(path) -> Dict[str, Any]:
+    """
+    Load a TOML file with tomllib, or the toml package before Python 3.11.
+
+    Parses are cached on the file's mtime, size and inode; the returned dict
+    is shared and must not be mutated.
+    """
+    st = os.stat(path)
+    return _load_toml_cached(os.fspath(path), st.st_mtime_ns, st.st_size, st.st_ino)
+
+@functools.lru_cache(maxsize=16)
+def _load_toml_cached(path_str: str, mtime_ns: int, size: int, ino: int) -> Dict[str, Any]:
+    if tomllib is not None:
+        with open(path_str, 'rb') as f:
+            return tomllib.load(f)
+    import toml
+    with open(path_str, 'r') as f:
+        return toml.load(f)
+
+# Static apps list in repo.toml, cleared after restructuring an application
+_APPS_LIST_RE = re.compile(rb'^apps\s*=\s*\[.*?\]', re.MULTILINE)
+
+# Normalization to build system platform/architecture names
+_SYSTEM_MAP = {'darwin': 'macos', 'windows': 'windows'}
+_ARCH_MAP = {
+    'x86_64': 'x86_64', 'amd64': 'x86_64',
+    'aarch64': 'aarch64', 'arm64': 'aarch64',
+    'i386': 'x86', 'i686': 'x86',
+}
+
+@functools.lru_cache(maxsize=1)
 def get_platform_info() -> Tuple[str, str]:
     """
     Get current platform and architecture.
@@ -37,25 +107,9 @@ def get_platform_info() -> Tuple[str, str]:
     system = platform.system().lower()
     machine = platform.machine().lower()
 
-    # Normalize platform name
-    if system == 'darwin':
-        platform_name = 'macos'
-    elif system == 'windows':
-        platform_name = 'windows'
-    else:
-        platform_name = 'linux'
-
-    # Normalize architecture
-    if machine in ['x86_64', 'amd64']:
-        arch = 'x86_64'
-    elif machine in ['aarch64', 'arm64']:
-        arch = 'aarch64'
-    elif machine in ['i386', 'i686']:
-        arch = 'x86'
-    else:
-        arch = machine
-
-    return platform_name, arch
+    # Anything that is not macOS or Windows builds as linux; unknown
+    # architectures pass through unchanged
+    return _SYSTEM_MAP.get(system, 'linux'), _ARCH_MAP.get(machine, machine)
 
 def get_platform_build_dir(repo_root: Path, config: str = 'release') -> Path:
     """
@@ -72,6 +126,9 @@ def get_platform_build_dir(repo_root: Path, config: str = 'release') -> Path:
     platform_name, arch = get_platform_info()
     return repo_root / "_build" / f"{platform_name}-{arch}" / config
 
+# Maps option dashes to keyword underscores (--display-name -> display_name)
+_DASH_TRANS = str.maketrans('-', '_')
+
 def parse_template_new_args(args: List[str]) -> tuple[str, Dict[str, str], List[str]]:
     """Parse template new command arguments."""
     if len(args) < 3 or args[0] != "template" or args[1] != "new":
@@ -89,10 +146,10 @@ def parse_template_new_args(args: List[str]) -> tuple[str, Dict[str, str], List[
             if "=" in arg:
                 # Handle --key=value format
                 key, value = arg[2:].split("=", 1)
-                kwargs[key.replace("-", "_")] = value
+                kwargs[key.translate(_DASH_TRANS)] = value
             elif i + 1 < len(args) and not args[i + 1].startswith("--"):
                 # Handle --key value format
-                key = arg[2:].replace("-", "_")
+                key = arg[2:].translate(_DASH_TRANS)
                 kwargs[key] = args[i + 1]
                 i += 1
             else:
@@ -105,92 +162,36 @@ def parse_template_new_args(args: List[str]) -> tuple[str, Dict[str, str], List[
 
     return template_name, kwargs, remaining_args
 
-def _fix_application_structure(repo_root: Path, playback_data: Dict[str, Any], build_config: str = 'release', quiet: bool = False) -> None:
-    """
-    Fix application directory structure after template replay.
-
-    The template replay system creates app.kit as a FILE in source/apps/,
-    but we need it to be source/apps/{name}/{name}.kit (directory structure).
-    The build system will then symlink source/apps → _build/{platform}/{config}/apps
-
-    Args:
-        repo_root: Repository root directory
-        playback_data: Parsed playback TOML data
-        build_config: Build configuration (release or debug), defaults to release
-        quiet: If True, suppress output messages (for JSON mode)
-    """
-    platform_name, arch = get_platform_info()
-
-    # Determine if this is an application template
-    # Application templates have 'application_name' or 'application_display_name'
-    for template_name, config_data in playback_data.items():
-        if template_name.startswith('_'):
-            continue  # Skip internal fields like _standalone_project
-
-        app_name = config_data.get('application_name')
-        if not app_name:
-            # Not an application, skip (might be extension)
-            continue
-
-        # Check if .kit file exists in source/apps (where omni.repo.man creates it)
-        old_kit_file = repo_root / "source" / "apps" / f"{app_name}.kit"
-        if not old_kit_file.exists():
-            # File not found, might already be structured correctly or error occurred
-            continue
-
-        if old_kit_file.is_dir():
-            # Already a directory, skip
-            continue
-
-        # Found a .kit FILE that should be restructured into a directory
-        if not quiet:
-            print(f"\nRestructuring application: {app_name}")
-            print(f"Creating directory structure in source/apps/...")
-
-        # Create new directory structure in source/apps
-        # The build system will symlink this to _build/{platform}/{config}/apps
-        app_dir = repo_root / "source" / "apps" / app_name
-        app_dir.mkdir(parents=True, exist_ok=True)
-
-        # Move the .kit file into the directory
-        new_kit_file = app_dir / f"{app_name}.kit"
-        shutil.move(str(old_kit_file), str(new_kit_file))
-
-        # Copy README.md from template if it exists
-        template_readme = repo_root / "templates" / "apps" / template_name / "README.md"
-        if template_readme.exists():
-            shutil.copy2(str(template_readme), str(app_dir / "README.md"))
-
-        # Create .project-meta.toml with metadata
-        metadata_content = f"""# Project Metadata
+# .project-meta.toml written into each restructured application
+_METADATA_TEMPLATE = """# Project Metadata
 # Auto-generated by Kit App Template System
 
 [project]
-name = "{app_name}"
-display_name = "{config_data.get('application_display_name', app_name)}"
-version = "{config_data.get('version', '0.1.0')}"
+name = "{name}"
+display_name = "{display_name}"
+version = "{version}"
 type = "application"
-template = "{template_name}"
-created = "{__import__('datetime').datetime.now().isoformat()}"
+template = "{template}"
+created = "{created}"
 
 [build]
 platforms = ["windows", "linux"]
-config_file = "{app_name}.kit"
+config_file = "{name}.kit"
 build_dir = "_build"
 
 [files]
-main_config = "{app_name}.kit"
+main_config = "{name}.kit"
 readme = "README.md"
 """
 
-        metadata_file = app_dir / ".project-meta.toml"
-        metadata_file.write_text(metadata_content)
-
-        # Create wrapper script that finds repo root and calls main repo.sh
-        wrapper_script = app_dir / "repo.sh"
-        wrapper_content = """#!/bin/bash
+# Wrapper scripts that forward to the repository root repo.sh / repo.bat.
+# Stored as bytes so line endings are fixed: LF for sh, CRLF for cmd.exe.
+# @REPO_ROOT@ is replaced with the repository root at generation time
+_WRAPPER_SH = b"""#!/bin/bash
 # Wrapper script to call repository root repo.sh from any app directory
-# Automatically finds the repository root by walking up the directory tree
+# Uses the repository root recorded at generation time while this script
+# still lives inside it, and otherwise (repository moved, or app copied into
+# another clone or worktree) finds it by walking up the directory tree
 
 set -e
 
@@ -208,26 +209,37 @@ find_repo_root() {
     return 1
 }
 
-REPO_ROOT=$(find_repo_root)
-if [ $? -ne 0 ]; then
-    exit 1
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+REPO_ROOT='@REPO_ROOT@'
+case "$SCRIPT_DIR/" in
+    "$REPO_ROOT"/*) ;;
+    *) REPO_ROOT="" ;;
+esac
+if [ -z "$REPO_ROOT" ] || [ ! -f "$REPO_ROOT/repo.sh" ] || [ ! -f "$REPO_ROOT/repo.toml" ]; then
+    REPO_ROOT=$(find_repo_root)
+    if [ $? -ne 0 ]; then
+        exit 1
+    fi
 fi
 
 # Call the main repo.sh with all arguments
 exec "$REPO_ROOT/repo.sh" "$@"
 """
-        wrapper_script.write_text(wrapper_content)
-        import os
-        os.chmod(str(wrapper_script), 0o755)  # Make executable
 
-        # Create Windows batch wrapper
-        wrapper_bat = app_dir / "repo.bat"
-        wrapper_bat_content = """@echo off
+_WRAPPER_BAT = b"""@echo off
 REM Wrapper script to call repository root repo.bat from any app directory
-REM Automatically finds the repository root by walking up the directory tree
+REM Uses the repository root recorded at generation time while this script
+REM still lives inside it, and otherwise (repository moved, or app copied into
+REM another clone or worktree) finds it by walking up the directory tree
 
 setlocal enabledelayedexpansion
 
+set "REPO_ROOT=@REPO_ROOT@"
+set "SCRIPT_DIR=%~dp0"
+set "SCRIPT_REL=!SCRIPT_DIR:%REPO_ROOT%\\=!"
+if /i not "%REPO_ROOT%\\!SCRIPT_REL!"=="!SCRIPT_DIR!" goto find_repo_root
+if exist "%REPO_ROOT%\\repo.bat" if exist "%REPO_ROOT%\\repo.toml" goto found
+
 :find_repo_root
 set "current_dir=%CD%"
 
@@ -254,23 +266,118 @@ goto loop
 REM Call the main repo.bat with all arguments
 call "%REPO_ROOT%\\repo.bat" %*
 exit /b %ERRORLEVEL%
-"""
-        wrapper_bat.write_text(wrapper_bat_content)
+""".replace(b"\n", b"\r\n")
+
+def _render_wrappers(repo_root: Path) -> Tuple[bytes, bytes]:
+    """Return the (repo.sh, repo.bat) wrapper contents for a repository root."""
+    root = os.path.abspath(repo_root)
+    # Single-quoted in sh, so only embedded single quotes need escaping
+    sh_root = os.fsencode(root.replace("'", "'\\''"))
+    return (_WRAPPER_SH.replace(b"@REPO_ROOT@", sh_root),
+            _WRAPPER_BAT.replace(b"@REPO_ROOT@", os.fsencode(root)))
+
+def _fix_application_structure(repo_root: Path, playback_data: Dict[str, Any], build_config: str = 'release', quiet: bool = False) -> None:
+    """
+    Fix application directory structure after template replay.
+
+    The template replay system creates app.kit as a FILE in source/apps/,
+    but we need it to be source/apps/{name}/{name}.kit (directory structure).
+    The build system will then symlink source/apps → _build/{platform}/{config}/apps
+
+    Args:
+        repo_root: Repository root directory
+        playback_data: Parsed playback TOML data
+        build_config: Build configuration (release or debug), defaults to release
+        quiet: If True, suppress output messages (for JSON mode)
+    """
+    # Nothing to restructure for extension-only playbacks
+    if not any(
+        isinstance(config_data, dict) and 'application_name' in config_data
+        for template_name, config_data in playback_data.items()
+        if not template_name.startswith('_')
+    ):
+        return None
+
+    platform_name, arch = get_platform_info()
+
+    # Determine if this is an application template
+    # Application templates have 'application_name' or 'application_display_name'
+    for template_name, config_data in playback_data.items():
+        if template_name.startswith('_'):
+            continue  # Skip internal fields like _standalone_project
+
+        app_name = config_data.get('application_name')
+        if not app_name:
+            # Not an application, skip (might be extension)
+            continue
+
+        # Check if .kit file exists in source/apps (where omni.repo.man creates it)
+        old_kit_file = repo_root / "source" / "apps" / f"{app_name}.kit"
+        if not old_kit_file.exists():
+            # File not found, might already be structured correctly or error occurred
+            continue
+
+        if old_kit_file.is_dir():
+            # Already a directory, skip
+            continue
+
+        # Found a .kit FILE that should be restructured into a directory
+        if not quiet:
+            print(f"\nRestructuring application: {app_name}")
+            print(f"Creating directory structure in source/apps/...")
+
+        # Create new directory structure in source/apps
+        # The build system will symlink this to _build/{platform}/{config}/apps
+        app_dir = repo_root / "source" / "apps" / app_name
+        app_dir.mkdir(parents=True, exist_ok=True)
+
+        # Move the .kit file into the directory (same filesystem, so a rename)
+        new_kit_file = app_dir / f"{app_name}.kit"
+        os.replace(old_kit_file, new_kit_file)
+
+        # Copy README.md from template if it exists
+        template_readme = repo_root / "templates" / "apps" / template_name / "README.md"
+        if template_readme.exists():
+            copy_file(template_readme, app_dir / "README.md")
+
+        # Create .project-meta.toml with metadata
+        metadata_content = _METADATA_TEMPLATE.format_map({
+            'name': app_name,
+            'display_name': config_data.get('application_display_name', app_name),
+            'version': config_data.get('version', '0.1.0'),
+            'template': template_name,
+            'created': datetime.now().isoformat(),
+        })
+
+        metadata_file = app_dir / ".project-meta.toml"
+        write_bytes(metadata_file, metadata_content.encode())
+
+        # Create wrapper script that finds repo root and calls main repo.sh
+        wrapper_sh_content, wrapper_bat_content = _render_wrappers(repo_root)
+        wrapper_script = app_dir / "repo.sh"
+        write_bytes(wrapper_script, wrapper_sh_content)
+        os.chmod(wrapper_script, 0o755)  # Make executable
+
+        # Create Windows batch wrapper
+        wrapper_bat = app_dir / "repo.bat"
+        write_bytes(wrapper_bat, wrapper_bat_content)
 
         if not quiet:
-            print(f"✓ Application '{app_name}' created successfully in")
-            print(f"  {app_dir}")
-            print("")
-            print(f"Main configuration: {app_name}.kit")
-            print("")
-            print(f"To build (from repository root):")
-            print(f"  cd {repo_root} && ./repo.sh build --config {build_config}")
-            print("")
-            print(f"Or build from app directory:")
-            print(f"  cd {app_dir} && ./repo.sh build --config {build_config}")
-            print("")
-            print(f"Note: Build system will symlink to: _build/{platform_name}-{arch}/{build_config}/apps/{app_name}")
-            print("")
+            sys.stdout.write(
+                f"✓ Application '{app_name}' created successfully in\n"
+                f"  {app_dir}\n"
+                "\n"
+                f"Main configuration: {app_name}.kit\n"
+                "\n"
+                "To build (from repository root):\n"
+                f"  cd {repo_root} && ./repo.sh build --config {build_config}\n"
+                "\n"
+                "Or build from app directory:\n"
+                f"  cd {app_dir} && ./repo.sh build --config {build_config}\n"
+                "\n"
+                f"Note: Build system will symlink to: _build/{platform_name}-{arch}/{build_config}/apps/{app_name}\n"
+                "\n"
+            )
 
         # Create the symlink immediately so UI can access files before first build
         # The build system will reuse this symlink if it already exists
@@ -278,48 +385,93 @@ exit /b %ERRORLEVEL%
         symlink_path = platform_build_dir / "apps"
         symlink_target = repo_root / "source" / "apps"
 
-        # Create symlink if it doesn't exist
-        if not symlink_path.exists():
+        # Create symlink if it doesn't exist (one lstat answers both checks)
+        try:
+            st = os.lstat(symlink_path)
+        except FileNotFoundError:
             symlink_path.parent.mkdir(parents=True, exist_ok=True)
             try:
                 symlink_path.symlink_to(symlink_target)
                 if not quiet:
                     print(f"✓ Created symlink: {symlink_path} → {symlink_target}")
             except Exception as e:
-                logger.warning(f"Could not create symlink (build system will create it): {e}")
-        elif symlink_path.is_symlink():
-            if not quiet:
-                print(f"✓ Symlink already exists: {symlink_path} → {symlink_path.readlink()}")
+                logger.warning("Could not create symlink (build system will create it): %s", e)
         else:
-            logger.warning(f"Path exists but is not a symlink: {symlink_path}")
+            if stat.S_ISLNK(st.st_mode):
+                if not quiet:
+                    print(f"✓ Symlink already exists: {symlink_path} → {symlink_path.readlink()}")
+            else:
+                logger.warning("Path exists but is not a symlink: %s", symlink_path)
 
         # Fix repo.toml: The template replay adds entries with flat paths
         # (e.g., "source/apps/app.kit") but we've restructured to nested paths
         # (e.g., "source/apps/app/app.kit"). Since we use dynamic discovery
         # via app_discovery_paths, clear the static apps list to prevent build errors.
         try:
-            import re
             repo_toml_path = repo_root / "repo.toml"
             if repo_toml_path.exists():
-                content = repo_toml_path.read_text()
+                content = repo_toml_path.read_bytes()
 
                 # Use regex to clear the apps list without reformatting the file
                 # This preserves comments and formatting
-                pattern = r'^apps\s*=\s*\[.*?\]'
-                replacement = 'apps = []'
-                new_content, count = re.subn(pattern, replacement, content, flags=re.MULTILINE)
+                new_content, count = _APPS_LIST_RE.subn(b'apps = []', content)
 
                 if count > 0:
-                    repo_toml_path.write_text(new_content)
+                    repo_toml_path.write_bytes(new_content)
                     if not quiet:
                         print(f"✓ Cleared static apps list in repo.toml (using dynamic discovery)")
         except Exception as e:  # noqa: BLE001
-            logger.warning(f"Could not update repo.toml after restructuring: {e}")
+            logger.warning("Could not update repo.toml after restructuring: %s", e)
             # Continue anyway - this is not critical as dynamic discovery should work
 
         # Return the new app directory path for API consumers
         return app_dir
 
+def _run_template_engine_in_process(repo_root: Path, engine_args: List[str], capture_stderr: bool):
+    """
+    Run template_engine's generate command inside this interpreter.
+
+    Saves the interpreter startup of a separate template_engine.py process;
+    the dispatcher already runs under the same (packman) Python.
+
+    Returns:
+        Tuple of (exit code, stdout text), or None if template_engine cannot
+        be imported and the caller should run it as a subprocess
+    """
+    import contextlib
+    import io
+
+    tools_dir = str(repo_root / "tools" / "repoman")
+    if tools_dir not in sys.path:
+        sys.path.insert(0, tools_dir)
+    try:
+        import template_engine
+    except ImportError:
+        return None
+
+    stdout = io.StringIO()
+    stderr = io.StringIO() if capture_stderr else sys.stderr
+    original_dir = os.getcwd()
+    os.chdir(repo_root)
+    try:
+        with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(stderr):
+            engine = template_engine.TemplateEngine(str(repo_root))
+            template_engine.handle_generate_command(engine, engine_args[0], engine_args[1:])
+        returncode = 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            returncode = e.code or 0
+        else:
+            print(e.code, file=sys.stderr)
+            returncode = 1
+    except Exception as e:
+        # Mirror template_engine.main()'s top-level error handling
+        print(f"Error: {e}", file=sys.stderr)
+        returncode = 1
+    finally:
+        os.chdir(original_dir)
+    return returncode, stdout.getvalue().strip()
+
 def handle_template_command(args: List[str]) -> int:
     """Handle template commands with enhanced functionality."""
     repo_root = get_repo_root()
@@ -351,38 +503,47 @@ def handle_template_command(args: List[str]) -> int:
             template_engine = repo_root / "tools" / "repoman" / "template_engine.py"
             template_helper = repo_root / "tools" / "repoman" / "template_helper.py"
 
-            if template_engine.exists():
+            if _tool_exists(template_engine):
                 # Run template engine to generate playbook
-                import subprocess
                 python_cmd = get_python_command(repo_root)
 
                 try:
                     # In JSON mode, capture all output; otherwise let stderr passthrough
-                    if json_mode:
+                    engine_result = _run_template_engine_in_process(
+                        repo_root, engine_args, capture_stderr=json_mode)
+                    if engine_result is not None:
+                        returncode, stdout_text = engine_result
+                    elif json_mode:
                         result = subprocess.run([
-                            python_cmd, str(template_engine)
+                            python_cmd, os.fspath(template_engine)
                         ] + engine_args,
                         capture_output=True,  # Capture both stdout and stderr in JSON mode
-                        text=True, cwd=str(repo_root))
+                        text=True, cwd=os.fspath(repo_root))
+                        returncode = result.returncode
+                        stdout_text = result.stdout.strip()
                     else:
-                        result = subprocess.run([
-                            python_cmd, str(template_engine)
+                        # Only the first stdout line (the playback file path) is
+                        # needed; drain the rest without keeping it so the
+                        # engine never blocks on a full pipe
+                        with subprocess.Popen([
+                            python_cmd, os.fspath(template_engine)
                         ] + engine_args,
-                        capture_output=False,  # Let stderr passthrough
-                        stdout=subprocess.PIPE,  # But capture stdout (playback file path)
-                        text=True, cwd=str(repo_root))
+                        stdout=subprocess.PIPE,  # Capture stdout (playback file path)
+                        text=True, cwd=os.fspath(repo_root)) as proc:
+                            stdout_text = proc.stdout.readline().strip()
+                            for _ in proc.stdout:
+                                pass
+                        returncode = proc.returncode
 
-                    if result.returncode != 0:
-                        return result.returncode
+                    if returncode != 0:
+                        return returncode
 
                     # Extract playback file from output
                     # Could be plain text (just the path) or JSON (with playback_file field)
-                    stdout_text = result.stdout.strip()
                     json_output_data = None
                     
                     try:
                         # Try parsing as JSON first
-                        import json
                         output_data = json.loads(stdout_text)
                         if isinstance(output_data, dict) and 'playback_file' in output_data:
                             playback_file = output_data['playback_file']
@@ -397,16 +558,7 @@ def handle_template_command(args: List[str]) -> int:
                     # Check if this is a standalone project by reading the playback file
                     standalone_dir = None
                     try:
-                        try:
-                            import tomllib
-                            # Python 3.11+ tomllib needs binary mode
-                            with open(playback_file, 'rb') as f:
-                                playback_data = tomllib.load(f)
-                        except ImportError:
-                            # Fallback to toml library which needs text mode
-                            import toml
-                            with open(playback_file, 'r') as f:
-                                playback_data = toml.load(f)
+                        playback_data = _load_toml_file(playback_file)
 
                         if "_standalone_project" in playback_data:
                             standalone_dir = playback_data["_standalone_project"].get("output_directory")
@@ -421,9 +573,9 @@ def handle_template_command(args: List[str]) -> int:
                     shim_path = str(repo_root / 'tools' / 'pm_shims')
                     env['PYTHONPATH'] = f"{shim_path}:{env.get('PYTHONPATH','')}"
                     result = subprocess.run([
-                        python_cmd, str(repo_root / "tools" / "repoman" / "repoman.py"),
+                        python_cmd, _repoman_script(repo_root, "repoman.py"),
                         "template", "replay", playback_file
-                    ], cwd=str(repo_root),
+                    ], cwd=os.fspath(repo_root),
                     capture_output=json_mode,  # Silence replay in JSON mode
                     text=True, env=env)
 
@@ -448,7 +600,8 @@ def handle_template_command(args: List[str]) -> int:
                                         output_dir=Path(standalone_config['output_directory']),
                                         template_name=standalone_config['template_name'],
                                         app_name=standalone_config['app_name'],
-                                        template_type=standalone_config['template_type']
+                                        template_type=standalone_config['template_type'],
+                                        hardlink=standalone_config.get('hardlink', False)
                                     )
 
                                     print(f"\n✓ Standalone project created: {standalone_path}", file=sys.stderr)
@@ -486,7 +639,7 @@ def handle_template_command(args: List[str]) -> int:
                     print(f"Error running template engine: {e}", file=sys.stderr)
                     return 1
 
-            elif template_helper.exists():
+            elif _tool_exists(template_helper):
                 # Fallback to old helper
                 legacy_args = [template_name]
                 if "name" in kwargs:
@@ -496,39 +649,35 @@ def handle_template_command(args: List[str]) -> int:
                 if "version" in kwargs:
                     legacy_args.append(kwargs["version"])
 
-                import subprocess
                 python_cmd = get_python_command(repo_root)
 
                 try:
+                    # On success stdout carries only the playback path. The
+                    # helper prints its errors (unknown template, usage) to
+                    # stdout, so on failure echo both streams
                     result = subprocess.run([
-                        python_cmd, str(template_helper)
+                        python_cmd, os.fspath(template_helper)
                     ] + legacy_args,
-                    capture_output=True, text=True, cwd=str(repo_root))
+                    capture_output=True, text=True, cwd=os.fspath(repo_root))
 
                     if result.returncode != 0:
-                        print(result.stderr, file=sys.stderr)
+                        sys.stderr.write(result.stdout)
+                        sys.stderr.write(result.stderr)
                         return result.returncode
 
                     playback_file = result.stdout.strip()
 
+                    # Read playback data up front, as the engine branch does
+                    playback_data = _load_toml_file(playback_file)
+
                     # Run template replay with generated playbook file
                     result = subprocess.run([
-                        python_cmd, str(repo_root / "tools" / "repoman" / "repoman.py"),
+                        python_cmd, _repoman_script(repo_root, "repoman.py"),
                         "template", "replay", playback_file
-                    ], cwd=str(repo_root))
+                    ], cwd=os.fspath(repo_root))
 
                     # Post-process: Fix directory structure for applications
                     if result.returncode == 0:
-                        # Read playback data
-                        try:
-                            import tomllib
-                            with open(playback_file, 'rb') as f:
-                                playback_data = tomllib.load(f)
-                        except ImportError:
-                            import toml
-                            with open(playback_file, 'r') as f:
-                                playback_data = toml.load(f)
-
                         _fix_application_structure(repo_root, playback_data)
 
                     return result.returncode
@@ -547,8 +696,7 @@ def handle_template_command(args: List[str]) -> int:
     elif subcommand == "docs":
         # Handle template docs command
         template_engine = repo_root / "tools" / "repoman" / "template_engine.py"
-        if template_engine.exists():
-            import subprocess
+        if _tool_exists(template_engine):
             python_cmd = get_python_command(repo_root)
 
             docs_args = ["docs"]
@@ -563,16 +711,15 @@ def handle_template_command(args: List[str]) -> int:
             shim_path = str(repo_root / 'tools' / 'pm_shims')
             env['PYTHONPATH'] = f"{shim_path}:{env.get('PYTHONPATH','')}"
             return subprocess.run([
-                python_cmd, str(template_engine)
-            ] + docs_args, cwd=str(repo_root), env=env).returncode
+                python_cmd, os.fspath(template_engine)
+            ] + docs_args, cwd=os.fspath(repo_root), env=env).returncode
         else:
             return call_repoman(args)
 
     elif subcommand == "list":
         # Handle template list command
         template_engine = repo_root / "tools" / "repoman" / "template_engine.py"
-        if template_engine.exists():
-            import subprocess
+        if _tool_exists(template_engine):
             python_cmd = get_python_command(repo_root)
 
             list_args = ["list"]
@@ -582,8 +729,8 @@ def handle_template_command(args: List[str]) -> int:
             shim_path = str(repo_root / 'tools' / 'pm_shims')
             env['PYTHONPATH'] = f"{shim_path}:{env.get('PYTHONPATH','')}"
             return subprocess.run([
-                python_cmd, str(template_engine)
-            ] + list_args, cwd=str(repo_root), env=env).returncode
+                python_cmd, os.fspath(template_engine)
+            ] + list_args, cwd=os.fspath(repo_root), env=env).returncode
         else:
             return call_repoman(args)
 
@@ -591,14 +738,15 @@ def handle_template_command(args: List[str]) -> int:
         # Delegate to repoman for other template commands
         return call_repoman(args)
 
+@functools.lru_cache(maxsize=4)
 def get_python_command(repo_root: Path) -> str:
-    """Get the appropriate Python command for this repository."""
+    """Get the appropriate Python command for this repository (cached per root)."""
     packman_python = repo_root / "tools" / "packman" / "python.sh"
     packman_python_bat = repo_root / "tools" / "packman" / "python.bat"
 
-    if os.name == "nt" and packman_python_bat.exists():
+    if os.name == "nt" and _tool_exists(packman_python_bat):
         return str(packman_python_bat)
-    elif packman_python.exists():
+    elif _tool_exists(packman_python):
         return str(packman_python)
     else:
         return "python3" if os.name != "nt" else "python"
@@ -608,19 +756,18 @@ def call_repoman(args: List[str]) -> int:
     repo_root = get_repo_root()
     repoman_py = repo_root / "tools" / "repoman" / "repoman.py"
 
-    if not repoman_py.exists():
+    if not _tool_exists(repoman_py):
         print(f"Error: {repoman_py} not found", file=sys.stderr)
         return 1
 
-    import subprocess
     python_cmd = get_python_command(repo_root)
 
     env = dict(os.environ)
     shim_path = str(repo_root / 'tools' / 'pm_shims')
     env['PYTHONPATH'] = f"{shim_path}:{env.get('PYTHONPATH','')}"
     return subprocess.run([
-        python_cmd, str(repoman_py)
-    ] + args, cwd=str(repo_root), env=env).returncode
+        python_cmd, os.fspath(repoman_py)
+    ] + args, cwd=os.fspath(repo_root), env=env).returncode
 
 def main() -> int:
     """Main entry point."""
@@ -7,6 +7,7 @@ Integrates validate_kit_deps into the repo tool system.
 
 import argparse
 import logging
+import os
 import sys
 from pathlib import Path
 
@@ -15,12 +16,6 @@ TOOLS_DIR = Path(__file__).parent
 if str(TOOLS_DIR) not in sys.path:
     sys.path.insert(0, str(TOOLS_DIR))
 
-from validate_kit_deps import (
-    validate_kit_file,
-    validate_all_kit_files,
-    prefetch_extensions
-)
-
 logger = logging.getLogger(__name__)
 
 
@@ -31,6 +26,13 @@ def main(config: dict):
     Args:
         config: Configuration dict from repo tool system
     """
+    # Imported here so loading the repo tool doesn't pull in the validator
+    from validate_kit_deps import (
+        validate_kit_file,
+        validate_all_kit_files,
+        prefetch_extensions
+    )
+
     # Parse arguments
     parser = argparse.ArgumentParser(
         description='Validate Kit dependencies',
@@ -63,6 +65,23 @@ def main(config: dict):
         action='store_true',
         help='Stop on first error'
     )
+    parser.add_argument(
+        '--jobs',
+        '-j',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of .kit files to validate in parallel'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the on-disk registry lookup cache'
+    )
+    parser.add_argument(
+        '--refresh-cache',
+        action='store_true',
+        help='Re-query registries and refresh the lookup cache'
+    )
 
     args, _ = parser.parse_known_args()
 
@@ -97,7 +116,9 @@ def main(config: dict):
             args.kit_file,
             repo_root,
             check_registry,
-            args.config
+            args.config,
+            not args.no_cache,
+            args.refresh_cache
         )
 
         if not valid:
@@ -118,7 +139,10 @@ def main(config: dict):
             repo_root,
             check_registry,
             args.config,
-            args.fail_fast
+            args.fail_fast,
+            args.jobs,
+            not args.no_cache,
+            args.refresh_cache
         )
 
         if not all_valid:
@@ -6,218 +6,77 @@ Converts template-generated projects into self-contained standalone projects
 that can be built and run independently of the repository.
 """
 
-import shutil
 import os
+import shutil
+import string
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 import logging
 
-logger = logging.getLogger(__name__)
-
-
-class StandaloneGenerator:
-    """Generate standalone projects from templates."""
-
-    def __init__(self, repo_root: Path):
-        """
-        Initialize generator.
-
-        Args:
-            repo_root: Path to kit-app-template repository root
-        """
-        self.repo_root = Path(repo_root).resolve()
-
-    def generate_standalone(
-        self,
-        template_output_dir: Path,
-        standalone_dir: Path,
-        template_name: str,
-        app_name: str,
-        template_type: str = "application"
-    ) -> Path:
-        """
-        Convert a template-generated project into a standalone project.
-
-        Args:
-            template_output_dir: Directory where template created the app
-            standalone_dir: Target directory for standalone project
-            template_name: Name of template used
-            app_name: Application name
-            template_type: Type of template (application, extension, microservice)
-
-        Returns:
-            Path to created standalone project
-
-        Raises:
-            FileNotFoundError: If source files don't exist
-            FileExistsError: If standalone_dir already exists
-        """
-        template_output_dir = Path(template_output_dir).resolve()
-        standalone_dir = Path(standalone_dir).resolve()
-
-        logger.info(f"Generating standalone project: {standalone_dir}")
-        logger.info(f"  Template: {template_name}")
-        logger.info(f"  App name: {app_name}")
-        logger.info(f"  Type: {template_type}")
-
-        # Verify source exists
-        if not template_output_dir.exists():
-            raise FileNotFoundError(f"Template output not found: {template_output_dir}")
-
-        # Create standalone directory
-        if standalone_dir.exists():
-            raise FileExistsError(f"Standalone directory already exists: {standalone_dir}")
-
-        standalone_dir.mkdir(parents=True, exist_ok=False)
-
-        try:
-            # 1. Copy application/extension files
-            self._copy_application(template_output_dir, standalone_dir, app_name, template_type)
+# Add tools path for imports
+tools_path = Path(__file__).parent
+if str(tools_path) not in sys.path:
+    sys.path.insert(0, str(tools_path))
 
-            # 2. Copy build tools
-            self._copy_build_tools(standalone_dir)
-
-            # 3. Copy and modify configuration files
-            self._copy_config_files(standalone_dir, app_name, template_type)
-
-            # 4. Generate standalone-specific files
-            self._generate_premake(standalone_dir, app_name, template_type)
-            self._generate_readme(standalone_dir, template_name, app_name, template_type)
-
-            logger.info(f"✓ Standalone project created: {standalone_dir}")
-            return standalone_dir
+from fs_utils import clone_file, clonefile, copy_file, copytree, link_file, write_bytes
 
-        except Exception as e:
-            # Cleanup on failure
-            logger.error(f"Failed to generate standalone project: {e}")
-            if standalone_dir.exists():
-                shutil.rmtree(standalone_dir)
-            raise
-
-    def _copy_application(
-        self,
-        src_dir: Path,
-        dest_dir: Path,
-        app_name: str,
-        template_type: str
-    ):
-        """Copy application source files to standalone project."""
-        logger.info("Copying application files...")
-
-        # Create source directory structure
-        if template_type == "extension":
-            dest_source = dest_dir / "source" / "extensions" / app_name
-        else:  # application or microservice
-            dest_source = dest_dir / "source" / "apps" / app_name
-
-        dest_source.parent.mkdir(parents=True, exist_ok=True)
-
-        # Copy the entire application directory
-        shutil.copytree(src_dir, dest_source, dirs_exist_ok=True)
-
-        logger.info(f"  ✓ Copied to: {dest_source.relative_to(dest_dir)}")
-
-    def _copy_build_tools(self, dest_dir: Path):
-        """Copy packman and repoman tools."""
-        logger.info("Copying build tools...")
-
-        tools_dest = dest_dir / "tools"
-        tools_dest.mkdir(parents=True, exist_ok=True)
-
-        # Copy packman (full directory)
-        packman_src = self.repo_root / "tools" / "packman"
-        packman_dest = tools_dest / "packman"
-        if packman_src.exists():
-            shutil.copytree(packman_src, packman_dest, dirs_exist_ok=True)
-            logger.info(f"  ✓ Copied packman")
-
-        # Copy repoman (core files only)
-        repoman_src = self.repo_root / "tools" / "repoman"
-        repoman_dest = tools_dest / "repoman"
-        repoman_dest.mkdir(parents=True, exist_ok=True)
-
-        # Essential repoman files
-        repoman_files = [
-            "repoman.py",
-            "repo_dispatcher.py",
-            "launch.py",
-            "package.py",
-            "template_api.py",
-            "license_manager.py",
-        ]
+logger = logging.getLogger(__name__)
 
-        for filename in repoman_files:
-            src_file = repoman_src / filename
-            if src_file.exists():
-                shutil.copy2(src_file, repoman_dest / filename)
 
-        logger.info(f"  ✓ Copied repoman ({len(repoman_files)} files)")
+def _clone_tree(src: Path, dst: Path, hardlink: bool = False) -> str:
+    """
+    Materialize src at dst without copying file data where possible.
 
-        # Copy other tool scripts if needed
-        for script in ["package.sh", "package.bat", "validate_icons.py", "VERSION.md"]:
-            src_file = self.repo_root / "tools" / script
-            if src_file.exists():
-                shutil.copy2(src_file, tools_dest / script)
+    When dst is on the same filesystem as src, files are hardlinked (if
+    requested; only safe when the copy is treated as read-only), cloned with
+    clonefile on macOS, or reflinked on Linux. Anything else, including a
+    different filesystem, gets a regular parallel copy.
 
-    def _copy_config_files(
-        self,
-        dest_dir: Path,
-        app_name: str,
-        template_type: str
-    ):
-        """Copy and modify configuration files for standalone operation."""
-        logger.info("Copying configuration files...")
+    Returns:
+        Name of the method used
+    """
+    try:
+        same_fs = os.stat(src).st_dev == os.stat(os.path.dirname(dst)).st_dev
+    except OSError:
+        same_fs = False
 
-        # Copy repo.sh and repo.bat (main scripts, not wrappers)
-        for script in ["repo.sh", "repo.bat"]:
-            src_file = self.repo_root / script
-            dest_file = dest_dir / script
-            if src_file.exists():
-                shutil.copy2(src_file, dest_file)
-                # Make executable on Unix
-                if script.endswith(".sh"):
-                    dest_file.chmod(0o755)
+    if same_fs:
+        if hardlink:
+            copytree(src, dst, copy_function=link_file)
+            return "hardlink"
+        if sys.platform == 'darwin' and clonefile(src, dst):
+            return "clonefile"
+        if sys.platform.startswith('linux'):
+            copytree(src, dst, copy_function=clone_file)
+            return "reflink/copy"
 
-        logger.info(f"  ✓ Copied repo.sh and repo.bat")
+    copytree(src, dst)
+    return "copy"
 
-        # Copy repo.toml (will need modifications)
-        src_toml = self.repo_root / "repo.toml"
-        dest_toml = dest_dir / "repo.toml"
-        if src_toml.exists():
-            shutil.copy2(src_toml, dest_toml)
-            logger.info(f"  ✓ Copied repo.toml")
 
-        # Copy repo_tools.toml if exists
-        src_tools_toml = self.repo_root / "repo_tools.toml"
-        dest_tools_toml = dest_dir / "repo_tools.toml"
-        if src_tools_toml.exists():
-            shutil.copy2(src_tools_toml, dest_tools_toml)
+def _dir_entries(path) -> dict:
+    """
+    Map entry names to paths for one directory with a single scandir.
 
-        # Copy requirements.txt if exists
-        src_req = self.repo_root / "requirements.txt"
-        dest_req = dest_dir / "requirements.txt"
-        if src_req.exists():
-            shutil.copy2(src_req, dest_req)
-            logger.info(f"  ✓ Copied requirements.txt")
+    Lets callers test several candidate files with dict lookups rather than
+    one stat per name. Returns an empty dict if the directory is missing.
+    """
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry.path for entry in it}
+    except OSError:
+        return {}
 
-    def _generate_premake(
-        self,
-        dest_dir: Path,
-        app_name: str,
-        template_type: str
-    ):
-        """Generate standalone premake5.lua."""
-        logger.info("Generating premake5.lua...")
 
-        premake_file = dest_dir / "premake5.lua"
+def _source_kind(template_type: str) -> str:
+    """Return the source/ subdirectory a template type is placed under."""
+    return "extensions" if template_type == "extension" else "apps"
 
-        # Determine source path based on template type
-        if template_type == "extension":
-            app_path = f"source/extensions/{app_name}"
-        else:
-            app_path = f"source/apps/{app_name}"
 
-        premake_content = f'''-- Standalone premake5.lua for {app_name}
+# Generated file bodies, parsed once at import and filled in per project
+_PREMAKE_TEMPLATE = string.Template('''-- Standalone premake5.lua for ${app_name}
 -- Generated by kit-app-template standalone generator
 
 -- Configuration
@@ -225,9 +84,9 @@ BUILD_CONFIG = _OPTIONS["config"] or "release"
 BUILD_DIR = "_build"
 
 -- Root workspace
-workspace "{app_name}"
-    configurations {{ "debug", "release" }}
-    platforms {{ "x86_64" }}
+workspace "${app_name}"
+    configurations { "debug", "release" }
+    platforms { "x86_64" }
 
     location(BUILD_DIR)
 
@@ -236,59 +95,44 @@ workspace "{app_name}"
 
     -- Configuration-specific settings
     filter "configurations:debug"
-        defines {{ "DEBUG" }}
+        defines { "DEBUG" }
         symbols "On"
         optimize "Off"
 
     filter "configurations:release"
-        defines {{ "NDEBUG" }}
+        defines { "NDEBUG" }
         symbols "Off"
         optimize "On"
 
-    filter {{}}
+    filter {}
 
 -- Include application/extension build if present
-local app_premake = "{app_path}/premake5.lua"
+local app_premake = "${app_path}/premake5.lua"
 if os.isfile(app_premake) then
     include(app_premake)
 end
 
 -- Print build information
-print("Building standalone project: {app_name}")
+print("Building standalone project: ${app_name}")
 print("Configuration: " .. BUILD_CONFIG)
 print("Build directory: " .. BUILD_DIR)
-'''
-
-        premake_file.write_text(premake_content)
-        logger.info(f"  ✓ Generated premake5.lua")
-
-    def _generate_readme(
-        self,
-        dest_dir: Path,
-        template_name: str,
-        app_name: str,
-        template_type: str
-    ):
-        """Generate standalone README.md with usage instructions."""
-        logger.info("Generating README.md...")
-
-        readme_file = dest_dir / "README.md"
+''')
 
-        readme_content = f'''# {app_name} - Standalone Project
+_README_TEMPLATE = string.Template('''# ${app_name} - Standalone Project
 
-This is a standalone Kit application generated from the `{template_name}` template.
+This is a standalone Kit application generated from the `${template_name}` template.
 
 ## About This Project
 
-- **Template**: {template_name}
-- **Type**: {template_type}
-- **Name**: {app_name}
+- **Template**: ${template_name}
+- **Type**: ${template_type}
+- **Name**: ${app_name}
 - **Generated**: Standalone (self-contained)
 
 ## Project Structure
 
 ```
-{dest_dir.name}/
+${dest_name}/
 ├── repo.sh / repo.bat      # Build scripts
 ├── repo.toml               # Configuration
 ├── premake5.lua            # Build configuration
@@ -296,7 +140,7 @@ This is a standalone Kit application generated from the `{template_name}` templa
 │   ├── packman/            # Dependency manager
 │   └── repoman/            # Build system
 ├── source/                 # Source code
-│   └── {"extensions" if template_type == "extension" else "apps"}/{app_name}/
+│   └── ${source_kind}/${app_name}/
 └── README.md               # This file
 ```
 
@@ -326,10 +170,10 @@ Launch the application:
 
 ```bash
 # Linux/macOS
-./repo.sh launch --name {app_name}.kit
+./repo.sh launch --name ${app_name}.kit
 
 # Windows
-.\\repo.bat launch --name {app_name}.kit
+.\\repo.bat launch --name ${app_name}.kit
 ```
 
 ## Available Commands
@@ -345,7 +189,7 @@ Build the project. Default configuration is `release`.
 ### Launch Commands
 
 ```bash
-./repo.sh launch --name {app_name}.kit [additional args]
+./repo.sh launch --name ${app_name}.kit [additional args]
 ```
 
 Launch the built application.
@@ -360,9 +204,9 @@ Create a distributable package of your application.
 
 ## Development Workflow
 
-1. **Modify source code** in `source/{"extensions" if template_type == "extension" else "apps"}/{app_name}/`
+1. **Modify source code** in `source/${source_kind}/${app_name}/`
 2. **Rebuild**: `./repo.sh build`
-3. **Test**: `./repo.sh launch --name {app_name}.kit`
+3. **Test**: `./repo.sh launch --name ${app_name}.kit`
 4. **Package**: `./repo.sh package` (when ready to distribute)
 
 ## Directory Information
@@ -415,16 +259,16 @@ To share this project:
 
 ```bash
 # Create archive
-tar -czf {app_name}.tar.gz {dest_dir.name}/
+tar -czf ${app_name}.tar.gz ${dest_name}/
 
 # Or zip
-zip -r {app_name}.zip {dest_dir.name}/
+zip -r ${app_name}.zip ${dest_name}/
 ```
 
 Recipients can extract and build immediately:
 ```bash
-tar -xzf {app_name}.tar.gz
-cd {dest_dir.name}
+tar -xzf ${app_name}.tar.gz
+cd ${dest_name}
 ./repo.sh build
 ```
 
@@ -440,7 +284,7 @@ For more information about Kit development:
 
 ### Template Information
 
-Original template: `{template_name}`
+Original template: `${template_name}`
 
 ## License
 
@@ -456,12 +300,246 @@ For issues related to:
 ---
 
 **Generated by**: kit-app-template standalone generator
-**Template**: {template_name}
-**Type**: {template_type}
+**Template**: ${template_name}
+**Type**: ${template_type}
 **Self-contained**: Yes (no external dependencies on kit-app-template repository)
-'''
+''')
 
-        readme_file.write_text(readme_content)
+
+class StandaloneGenerator:
+    """Generate standalone projects from templates."""
+
+    def __init__(self, repo_root: Path, hardlink: bool = False):
+        """
+        Initialize generator.
+
+        Args:
+            repo_root: Path to kit-app-template repository root
+            hardlink: Hardlink packman files instead of copying them; only
+                for standalone projects whose tools/ tree is never modified
+        """
+        self.repo_root = Path(repo_root).resolve()
+        self.hardlink = hardlink
+
+        # Source directories read by every generation
+        self._tools_src = self.repo_root / "tools"
+        self._repoman_src = self._tools_src / "repoman"
+
+    def generate_standalone(
+        self,
+        template_output_dir: Path,
+        standalone_dir: Path,
+        template_name: str,
+        app_name: str,
+        template_type: str = "application"
+    ) -> Path:
+        """
+        Convert a template-generated project into a standalone project.
+
+        Args:
+            template_output_dir: Directory where template created the app
+            standalone_dir: Target directory for standalone project
+            template_name: Name of template used
+            app_name: Application name
+            template_type: Type of template (application, extension, microservice)
+
+        Returns:
+            Path to created standalone project
+
+        Raises:
+            FileNotFoundError: If source files don't exist
+            FileExistsError: If standalone_dir already exists
+        """
+        template_output_dir = Path(template_output_dir).resolve()
+        standalone_dir = Path(standalone_dir).resolve()
+
+        logger.info(f"Generating standalone project: {standalone_dir}")
+        logger.info(f"  Template: {template_name}")
+        logger.info(f"  App name: {app_name}")
+        logger.info(f"  Type: {template_type}")
+
+        # Verify source exists
+        if not template_output_dir.exists():
+            raise FileNotFoundError(f"Template output not found: {template_output_dir}")
+
+        # Create standalone directory
+        if standalone_dir.exists():
+            raise FileExistsError(f"Standalone directory already exists: {standalone_dir}")
+
+        standalone_dir.mkdir(parents=True, exist_ok=False)
+
+        try:
+            # 1-3. Copy application/extension files, build tools and
+            # configuration files, and 4. generate the standalone-specific
+            # files. Every step writes its own paths, so run them all
+            # concurrently
+            with ThreadPoolExecutor(max_workers=5) as pool:
+                steps = [
+                    pool.submit(self._copy_application, template_output_dir,
+                                standalone_dir, app_name, template_type),
+                    pool.submit(self._copy_build_tools, standalone_dir),
+                    pool.submit(self._copy_config_files, standalone_dir,
+                                app_name, template_type),
+                    pool.submit(self._generate_premake, standalone_dir,
+                                app_name, template_type),
+                    pool.submit(self._generate_readme, standalone_dir,
+                                template_name, app_name, template_type),
+                ]
+            for future in steps:
+                future.result()
+
+            logger.info(f"✓ Standalone project created: {standalone_dir}")
+            return standalone_dir
+
+        except Exception as e:
+            # Cleanup on failure
+            logger.error(f"Failed to generate standalone project: {e}")
+            if standalone_dir.exists():
+                shutil.rmtree(standalone_dir)
+            raise
+
+    def _copy_application(
+        self,
+        src_dir: Path,
+        dest_dir: Path,
+        app_name: str,
+        template_type: str
+    ):
+        """Copy application source files to standalone project."""
+        logger.info("Copying application files...")
+
+        # Create source directory structure
+        if template_type == "extension":
+            dest_source = dest_dir / "source" / "extensions" / app_name
+        else:  # application or microservice
+            dest_source = dest_dir / "source" / "apps" / app_name
+
+        dest_source.parent.mkdir(parents=True, exist_ok=True)
+
+        # Copy the entire application directory; standalone_dir is brand new,
+        # so nothing exists under it yet
+        copytree(src_dir, dest_source)
+
+        logger.info(f"  ✓ Copied to: {dest_source.relative_to(dest_dir)}")
+
+    def _copy_build_tools(self, dest_dir: Path):
+        """Copy packman and repoman tools."""
+        logger.info("Copying build tools...")
+
+        tools_dest = dest_dir / "tools"
+        tools_dest.mkdir(parents=True, exist_ok=True)
+
+        tools_src = _dir_entries(self._tools_src)
+
+        # Copy packman (full directory)
+        packman_dest = tools_dest / "packman"
+        if "packman" in tools_src:
+            method = _clone_tree(tools_src["packman"], packman_dest, self.hardlink)
+            logger.info(f"  ✓ Copied packman ({method})")
+
+        # Copy repoman (core files only)
+        repoman_src = _dir_entries(self._repoman_src)
+        repoman_dest = tools_dest / "repoman"
+        repoman_dest.mkdir(parents=True, exist_ok=True)
+
+        # Essential repoman files
+        repoman_files = [
+            "repoman.py",
+            "repo_dispatcher.py",
+            "launch.py",
+            "package.py",
+            "template_api.py",
+            "license_manager.py",
+            "fs_utils.py",
+        ]
+
+        with ThreadPoolExecutor(max_workers=len(repoman_files)) as pool:
+            copies = [
+                pool.submit(copy_file, repoman_src[filename], repoman_dest / filename)
+                for filename in repoman_files
+                if filename in repoman_src
+            ]
+        for future in copies:
+            future.result()
+
+        logger.info(f"  ✓ Copied repoman ({len(repoman_files)} files)")
+
+        # Copy other tool scripts if needed
+        for script in ["package.sh", "package.bat", "validate_icons.py", "VERSION.md"]:
+            if script in tools_src:
+                copy_file(tools_src[script], tools_dest / script)
+
+    def _copy_config_files(
+        self,
+        dest_dir: Path,
+        app_name: str,
+        template_type: str
+    ):
+        """Copy and modify configuration files for standalone operation."""
+        logger.info("Copying configuration files...")
+
+        root_src = _dir_entries(self.repo_root)
+
+        # Copy repo.sh and repo.bat (main scripts, not wrappers)
+        for script in ["repo.sh", "repo.bat"]:
+            dest_file = dest_dir / script
+            if script in root_src:
+                copy_file(root_src[script], dest_file)
+                # Make executable on Unix
+                if script.endswith(".sh"):
+                    dest_file.chmod(0o755)
+
+        logger.info(f"  ✓ Copied repo.sh and repo.bat")
+
+        # Copy repo.toml (will need modifications)
+        if "repo.toml" in root_src:
+            copy_file(root_src["repo.toml"], dest_dir / "repo.toml")
+            logger.info(f"  ✓ Copied repo.toml")
+
+        # Copy repo_tools.toml if exists
+        if "repo_tools.toml" in root_src:
+            copy_file(root_src["repo_tools.toml"], dest_dir / "repo_tools.toml")
+
+        # Copy requirements.txt if exists
+        if "requirements.txt" in root_src:
+            copy_file(root_src["requirements.txt"], dest_dir / "requirements.txt")
+            logger.info(f"  ✓ Copied requirements.txt")
+
+    def _generate_premake(
+        self,
+        dest_dir: Path,
+        app_name: str,
+        template_type: str
+    ):
+        """Generate standalone premake5.lua."""
+        logger.info("Generating premake5.lua...")
+
+        premake_file = dest_dir / "premake5.lua"
+
+        write_bytes(premake_file, _PREMAKE_TEMPLATE.substitute(
+            app_name=app_name,
+            app_path=f"source/{_source_kind(template_type)}/{app_name}",
+        ).encode('utf-8'))
+        logger.info(f"  ✓ Generated premake5.lua")
+
+    def _generate_readme(
+        self,
+        dest_dir: Path,
+        template_name: str,
+        app_name: str,
+        template_type: str
+    ):
+        """Generate standalone README.md with usage instructions."""
+        logger.info("Generating README.md...")
+
+        readme_file = dest_dir / "README.md"
+        write_bytes(readme_file, _README_TEMPLATE.substitute(
+            app_name=app_name,
+            template_name=template_name,
+            template_type=template_type,
+            dest_name=dest_dir.name,
+            source_kind=_source_kind(template_type),
+        ).encode('utf-8'))
         logger.info(f"  ✓ Generated README.md")
 
 
@@ -472,7 +550,8 @@ def create_standalone_project(
     output_dir: Optional[Path],
     template_name: str,
     app_name: str,
-    template_type: str = "application"
+    template_type: str = "application",
+    hardlink: bool = False
 ) -> Path:
     """
     Create standalone project (convenience function for CLI).
@@ -484,11 +563,12 @@ def create_standalone_project(
         template_name: Template name
         app_name: Application name
         template_type: Template type
+        hardlink: Hardlink packman files instead of copying them
 
     Returns:
         Path to created standalone project
     """
-    generator = StandaloneGenerator(repo_root)
+    generator = StandaloneGenerator(repo_root, hardlink=hardlink)
 
     # Determine standalone directory
     if output_dir is None:
@@ -30,19 +30,32 @@ Usage:
             print(f"Stream ready: {url}")
 """
 
+import functools
+import mmap
+import os
+import re
 import socket
 import time
 from pathlib import Path
 from typing import Optional, Literal
 
-try:
-    from omni.repo.kit_template.backend import read_toml
-except ImportError:
-    # Fallback for standalone usage
-    import toml
-    def read_toml(path):
-        with open(path, 'r') as f:
-            return toml.load(f)
+@functools.lru_cache(maxsize=None)
+def _toml_reader():
+    """Import the TOML reader on first use; URL/flag helpers never need it."""
+    try:
+        from omni.repo.kit_template.backend import read_toml
+    except ImportError:
+        # Fallback for standalone usage
+        import toml
+        def read_toml(path):
+            with open(path, 'r') as f:
+                return toml.load(f)
+    return read_toml
+
+
+def read_toml(path):
+    """Parse a TOML file with repo_kit_template's reader, or toml if absent."""
+    return _toml_reader()(path)
 
 
 # Real streaming extensions (not hallucinated!)
@@ -52,6 +65,91 @@ STREAMING_EXTENSIONS = {
     'gdn': 'omni.kit.gfn',                       # GeForce NOW (GDN)
 }
 
+# Extension names only, for membership tests on the detection path
+_STREAMING_EXTENSIONS_SET = frozenset(STREAMING_EXTENSIONS.values())
+
+# Quoted dependency keys as they appear in .kit files, for line scanning
+_STREAMING_DEPENDENCY_KEYS = tuple(
+    f'{quote}{ext}{quote}'.encode()
+    for ext in STREAMING_EXTENSIONS.values()
+    for quote in ('"', "'")
+)
+
+# Anything that can make a .kit file a streaming app: a streaming extension
+# name, or "streaming" in the template name. Files without any of these are
+# rejected without parsing
+_STREAMING_TOKEN_RE = re.compile(
+    b'|'.join(re.escape(ext.encode()) for ext in STREAMING_EXTENSIONS.values())
+    + rb'|(?i:streaming)'
+)
+
+# Kit flags for streaming mode; --no-window is essential, and the
+# livestream extension auto-starts when running headless
+_STREAMING_FLAGS = (
+    "--no-window",
+    "--/app/window/enabled=false",
+)
+
+# Hostnames that recently failed to resolve, mapped to the monotonic time
+# the failure expires. Readiness checks keep retrying resolution until
+# their deadline, but at most once per TTL per hostname, so polling for a
+# host that only resolves once its container starts doesn't hammer DNS
+_UNRESOLVABLE_TTL = 1.0
+_UNRESOLVABLE_HOSTS: dict = {}
+
+
+def _read_kit_toml(kit_file_path: Path) -> dict:
+    """
+    Parse a .kit file, reusing the last parse while the file is unchanged.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    st = os.stat(kit_file_path)
+    return _read_toml_cached(os.fspath(kit_file_path), st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@functools.lru_cache(maxsize=512)
+def _read_toml_cached(path_str: str, mtime_ns: int, size: int, ino: int) -> dict:
+    # mtime_ns, size and ino only key the cache; the inode catches a file
+    # replaced by rename with the same size and timestamp
+    return read_toml(Path(path_str))
+
+
+def _has_streaming_token(kit_file_path: Path) -> bool:
+    """Search the raw bytes of a .kit file for any streaming indicator."""
+    with open(kit_file_path, 'rb') as f:
+        try:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return _STREAMING_TOKEN_RE.search(mm) is not None
+        except ValueError:
+            # Empty files cannot be mapped
+            return False
+
+
+def _scan_for_streaming_dependency(kit_file_path: Path) -> bool:
+    """
+    Line-scan a .kit file for a streaming extension under [dependencies].
+
+    Stops at the first match, so streaming apps are detected without building
+    the whole TOML document. A False result is not conclusive; the caller
+    still parses the file for the template-name fallback.
+    """
+    in_dependencies = False
+    with open(kit_file_path, 'rb') as f:
+        for raw_line in f:
+            line = raw_line.strip()
+            if line.startswith(b'['):
+                header = line.split(b'#', 1)[0].rstrip()
+                in_dependencies = header == b'[dependencies]'
+                # [dependencies."omni.kit.gfn"] style sub-table
+                if header.startswith(b'[dependencies.') and any(
+                    key in header for key in _STREAMING_DEPENDENCY_KEYS
+                ):
+                    return True
+            elif in_dependencies and line.startswith(_STREAMING_DEPENDENCY_KEYS):
+                return True
+    return False
+
 
 def is_streaming_app(kit_file_path: Path) -> bool:
     """
@@ -72,18 +170,31 @@ def is_streaming_app(kit_file_path: Path) -> bool:
         >>> is_streaming_app(Path("source/apps/my_app/my_app_stream.kit"))
         True
     """
-    if not kit_file_path.exists():
+    try:
+        st = os.stat(kit_file_path)
+    except OSError:
         return False
+    return _is_streaming_app_cached(os.fspath(kit_file_path), st.st_mtime_ns, st.st_size, st.st_ino)
+
 
+@functools.lru_cache(maxsize=512)
+def _is_streaming_app_cached(path_str: str, mtime_ns: int, size: int, ino: int) -> bool:
+    kit_file_path = Path(path_str)
     try:
-        content = read_toml(kit_file_path)
+        # Fast paths: no streaming token anywhere rules the file out, and a
+        # streaming dependency line ends the search early
+        if not _has_streaming_token(kit_file_path):
+            return False
+        if _scan_for_streaming_dependency(kit_file_path):
+            return True
+
+        content = _read_toml_cached(path_str, mtime_ns, size, ino)
 
         # Check dependencies section for streaming extensions
         dependencies = content.get('dependencies', {})
 
-        for ext in STREAMING_EXTENSIONS.values():
-            if ext in dependencies:
-                return True
+        if not _STREAMING_EXTENSIONS_SET.isdisjoint(dependencies):
+            return True
 
         # Check template metadata for streaming indicator
         package = content.get('package', {})
@@ -116,7 +227,7 @@ def get_streaming_type(kit_file_path: Path) -> Optional[Literal['default', 'nvcf
         return None
 
     try:
-        content = read_toml(kit_file_path)
+        content = _read_kit_toml(kit_file_path)
         dependencies = content.get('dependencies', {})
 
         # Check for each streaming type
@@ -162,17 +273,12 @@ def get_streaming_flags(port: int = 47995) -> list:
         ['--no-window', '--/app/window/enabled=false']
     """
     # Set port via environment variable (extension may read this)
-    import os
     os.environ['LIVESTREAM_PORT'] = str(port)
 
-    # The --no-window flag is essential for streaming mode
-    # The extension will auto-start when running headless
-    return [
-        "--no-window",
-        "--/app/window/enabled=false",
-    ]
+    return list(_STREAMING_FLAGS)
 
 
+@functools.lru_cache(maxsize=32)
 def get_streaming_url(
     port: int = 47995,
     hostname: str = 'localhost',
@@ -205,18 +311,23 @@ def wait_for_streaming_ready(
     port: int = 47995,
     hostname: str = 'localhost',
     timeout: int = 60,
-    interval: float = 1.0
+    interval: float = 0.5
 ) -> bool:
     """
     Wait for the streaming server to become ready.
 
     Polls the streaming port until it accepts connections or timeout is reached.
+    The hostname is resolved once it resolves, and the delay between
+    attempts backs off exponentially from 25 ms up to ``interval``, so a
+    server that comes up quickly is noticed quickly. Resolution failures are
+    retried until the deadline, throttled to one lookup per second per
+    hostname across calls.
 
     Args:
         port: Streaming server port to check
         hostname: Server hostname (default: 'localhost')
         timeout: Maximum seconds to wait (default: 60)
-        interval: Seconds between checks (default: 1.0)
+        interval: Maximum seconds between checks (default: 0.5)
 
     Returns:
         True if server is ready, False if timeout
@@ -225,16 +336,35 @@ def wait_for_streaming_ready(
         >>> wait_for_streaming_ready(port=47995, timeout=30)
         True
     """
-    start_time = time.time()
-
-    while time.time() - start_time < timeout:
-        try:
-            with socket.create_connection((hostname, port), timeout=2):
-                return True
-        except (socket.timeout, socket.error, ConnectionRefusedError):
-            time.sleep(interval)
-
-    return False
+    deadline = time.monotonic() + timeout
+    addresses = ()
+
+    delay = 0.025
+    while True:
+        now = time.monotonic()
+        if not addresses and _UNRESOLVABLE_HOSTS.get(hostname, 0.0) <= now:
+            try:
+                addresses = socket.getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+            except socket.gaierror:
+                _UNRESOLVABLE_HOSTS[hostname] = now + _UNRESOLVABLE_TTL
+
+        for family, sock_type, proto, _, address in addresses:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                with socket.socket(family, sock_type, proto) as sock:
+                    sock.settimeout(min(2.0, remaining))
+                    sock.connect(address)
+                    return True
+            except OSError:
+                continue
+
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, interval)
 
 
 def get_streaming_config_path(
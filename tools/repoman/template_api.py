@@ -7,22 +7,41 @@ This module ensures that CLI and GUI use the exact same backend code,
 just with different binding mechanisms (in-process vs REST).
 """
 
-import sys
+import functools
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Union
 from dataclasses import dataclass
 import os
 import shutil
-from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent))
+if __package__:
+    # Imported as tools.repoman.template_api
+    from .template_engine import TemplateEngine, TemplateDiscovery
+    from .license_manager import LicenseManager, LICENSE_TEXT
+else:
+    # Run as a script, or imported with tools/repoman already on sys.path
+    from template_engine import TemplateEngine, TemplateDiscovery
+    from license_manager import LicenseManager, LICENSE_TEXT
+
+
+# TemplateAPI instances handed out by get_api(), by real repo root path
+_API_CACHE: Dict[str, "TemplateAPI"] = {}
 
-from template_engine import TemplateEngine, TemplateDiscovery  # noqa: E402
-from license_manager import LicenseManager  # noqa: E402
+
+@functools.lru_cache(maxsize=None)
+def _find_repo_root(start_dir: str) -> Optional[str]:
+    """Return the nearest directory at or above start_dir holding repo.toml."""
+    current = start_dir
+    while True:
+        parent = os.path.dirname(current)
+        if parent == current:
+            return None
+        if os.path.isfile(os.path.join(current, "repo.toml")):
+            return current
+        current = parent
 
 
-@dataclass
+@dataclass(slots=True)
 class TemplateGenerationRequest:
     """Request for generating a template."""
     template_name: str
@@ -39,7 +58,11 @@ class TemplateGenerationRequest:
     extra_params: Optional[Dict[str, Any]] = None
 
 
-@dataclass
+# Field names accepted when a request is given as a dict
+_REQUEST_FIELDS = frozenset(TemplateGenerationRequest.__annotations__)
+
+
+@dataclass(slots=True)
 class TemplateGenerationResult:
     """Result of template generation."""
     success: bool
@@ -49,7 +72,18 @@ class TemplateGenerationResult:
     created_files: Optional[List[str]] = None
 
 
-@dataclass
+_LICENSE_NOT_ACCEPTED = (
+    "License terms have not been accepted. "
+    "Set accept_license=True or accept manually."
+)
+
+
+def _fail(error: str) -> TemplateGenerationResult:
+    """Build a failed TemplateGenerationResult carrying only an error."""
+    return TemplateGenerationResult(success=False, error=error)
+
+
+@dataclass(slots=True)
 class TemplateInfo:
     """Template information."""
     name: str
@@ -62,7 +96,22 @@ class TemplateInfo:
     documentation: Dict[str, Any]
 
 
-@dataclass
+def _template_info(name: str, config: Dict[str, Any]) -> TemplateInfo:
+    """Build a TemplateInfo from a template's engine configuration."""
+    metadata = config.get('metadata', {})
+    return TemplateInfo(
+        name=name,
+        display_name=metadata.get('display_name', name),
+        type=metadata.get('type', 'unknown'),
+        category=metadata.get('category'),
+        description=metadata.get('description', ''),
+        version=metadata.get('version', '0.0.0'),
+        tags=metadata.get('tags', {}).get('tags', []),
+        documentation=config.get('documentation', {})
+    )
+
+
+@dataclass(slots=True)
 class LicenseStatus:
     """License acceptance status."""
     accepted: bool
@@ -87,19 +136,49 @@ class TemplateAPI:
         if repo_root:
             self.repo_root = Path(repo_root)
         else:
-            # Auto-detect repo root
-            current = Path(__file__).parent
-            while current.parent != current:
-                if (current / "repo.toml").exists():
-                    self.repo_root = current
-                    break
-                current = current.parent
-            else:
-                self.repo_root = Path(__file__).parent / ".." / ".."
+            # Auto-detect repo root, falling back to two levels above
+            # tools/repoman; a Path is only built for the final answer
+            here = os.path.dirname(os.path.abspath(__file__))
+            self.repo_root = Path(
+                _find_repo_root(here) or os.path.dirname(os.path.dirname(here))
+            )
 
         self.engine = TemplateEngine(str(self.repo_root))
         self.discovery = TemplateDiscovery(str(self.repo_root))
         self.license_manager = LicenseManager()
+        # Acceptance is sticky, so once seen it isn't re-read from disk
+        self._license_accepted: Optional[bool] = None
+
+        # list_templates() results by (template_type, category), a name
+        # index over them, and the templates/ signature they were built from
+        self._list_cache: Dict[tuple, List[TemplateInfo]] = {}
+        self._name_index: Dict[str, TemplateInfo] = {}
+        self._templates_signature: Optional[tuple] = None
+
+    def _templates_dir_signature(self) -> tuple:
+        """
+        mtimes of templates/ and its immediate subdirectories.
+
+        Adding or removing a template directory changes the mtime of its
+        parent (templates/applications, templates/extensions, ...), so this
+        detects new and deleted templates with a single scandir.
+        """
+        templates_dir = self.repo_root / "templates"
+        try:
+            with os.scandir(templates_dir) as it:
+                return tuple(sorted(
+                    (entry.name, entry.stat().st_mtime_ns)
+                    for entry in it if entry.is_dir()
+                )) + (os.stat(templates_dir).st_mtime_ns,)
+        except OSError:
+            return ()
+
+    def invalidate(self) -> None:
+        """Forget cached template listings and re-discover on next use."""
+        self._list_cache.clear()
+        self._name_index.clear()
+        self._templates_signature = None
+        self.engine.template_discovery.invalidate()
 
     # ============= License Operations =============
 
@@ -126,7 +205,10 @@ class TemplateAPI:
         Returns:
             True if acceptance stored successfully
         """
-        return self.license_manager.accept_license()
+        accepted = self.license_manager.accept_license()
+        if accepted:
+            self._license_accepted = True
+        return accepted
 
     def get_license_text(self) -> str:
         """
@@ -135,7 +217,6 @@ class TemplateAPI:
         Returns:
             License text string
         """
-        from license_manager import LICENSE_TEXT
         return LICENSE_TEXT
 
     # ============= Template Discovery Operations =============
@@ -154,26 +235,32 @@ class TemplateAPI:
 
         Returns:
             List of TemplateInfo objects
+
+        Results are cached per filter and rebuilt when a template directory
+        is added or removed (see invalidate() for other changes).
         """
+        signature = self._templates_dir_signature()
+        if signature != self._templates_signature:
+            self.invalidate()
+            self._templates_signature = signature
+
+        key = (template_type, category)
+        cached = self._list_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
         templates_dict = self.engine.list_templates(
             template_type, category
         )
 
-        result = []
-        for name, config in templates_dict.items():
-            metadata = config.get('metadata', {})
-            result.append(TemplateInfo(
-                name=name,
-                display_name=metadata.get('display_name', name),
-                type=metadata.get('type', 'unknown'),
-                category=metadata.get('category'),
-                description=metadata.get('description', ''),
-                version=metadata.get('version', '0.0.0'),
-                tags=metadata.get('tags', {}).get('tags', []),
-                documentation=config.get('documentation', {})
-            ))
-
-        return result
+        result = [
+            _template_info(name, config)
+            for name, config in templates_dict.items()
+        ]
+
+        self._list_cache[key] = result
+        self._name_index.update({t.name: t for t in result})
+        return list(result)
 
     def get_template(self, template_name: str) -> Optional[TemplateInfo]:
         """
@@ -185,11 +272,9 @@ class TemplateAPI:
         Returns:
             TemplateInfo object or None if not found
         """
-        templates = self.list_templates()
-        for template in templates:
-            if template.name == template_name:
-                return template
-        return None
+        # Fills the name index, or refreshes it if templates/ changed
+        self.list_templates()
+        return self._name_index.get(template_name)
 
     def get_template_docs(
         self, template_name: str
@@ -222,47 +307,34 @@ class TemplateAPI:
         # Convert dict to TemplateGenerationRequest if needed
         if isinstance(request, dict):
             # Extract known fields
-            req_dict = {
-                k: v for k, v in request.items()
-                if k in TemplateGenerationRequest.__annotations__
-            }
-            request = TemplateGenerationRequest(**req_dict)
+            request = TemplateGenerationRequest(
+                **{k: request[k] for k in _REQUEST_FIELDS if k in request}
+            )
 
-        # Check license
-        if not self.license_manager.is_license_accepted():
+        # Check license; only a positive answer is cached, so acceptance
+        # recorded by another process is still picked up
+        if not self._license_accepted:
+            self._license_accepted = self.license_manager.is_license_accepted()
+        if not self._license_accepted:
             if request.accept_license:
-                self.license_manager.accept_license()
+                self.accept_license()
             else:
-                return TemplateGenerationResult(
-                    success=False,
-                    error=(
-                        "License terms have not been accepted. "
-                        "Set accept_license=True or accept manually."
-                    )
-                )
+                return _fail(_LICENSE_NOT_ACCEPTED)
 
         try:
-            # Build kwargs from request
+            # Build kwargs from request; layers and force_overwrite only
+            # when set, and extra params last so they take precedence
             kwargs = {
                 'name': request.name,
                 'display_name': request.display_name,
                 'version': request.version,
+                **({'add_layers': 'Yes'} if request.add_layers else {}),
+                **({'layers': request.layers}
+                   if request.add_layers and request.layers else {}),
+                **({'force_overwrite': True} if request.force_overwrite else {}),
+                **(request.extra_params or {}),
             }
 
-            # Add layers if specified
-            if request.add_layers:
-                kwargs['add_layers'] = 'Yes'
-                if request.layers:
-                    kwargs['layers'] = request.layers
-
-            # Add force_overwrite if specified
-            if request.force_overwrite:
-                kwargs['force_overwrite'] = True
-
-            # Add extra params
-            if request.extra_params:
-                kwargs.update(request.extra_params)
-
             # Generate template
             playback = self.engine.generate_template(
                 request.template_name,
@@ -285,15 +357,9 @@ class TemplateAPI:
             )
 
         except ValueError as e:
-            return TemplateGenerationResult(
-                success=False,
-                error=str(e)
-            )
+            return _fail(str(e))
         except Exception as e:  # noqa: BLE001
-            return TemplateGenerationResult(
-                success=False,
-                error=f"Failed to generate template: {str(e)}"  # noqa: E501
-            )
+            return _fail(f"Failed to generate template: {str(e)}")
 
     def generate_template_simple(self, template_name: str, name: str,
                                  display_name: str, version: str = "0.1.0",
@@ -727,13 +793,20 @@ def get_api(repo_root: Optional[str] = None) -> TemplateAPI:
     """
     Get a TemplateAPI instance.
 
+    Instances are shared per repository root, so repeated calls don't
+    rebuild the template engine, discovery and license manager.
+
     Args:
         repo_root: Repository root directory
 
     Returns:
         TemplateAPI instance
     """
-    return TemplateAPI(repo_root)
+    key = os.path.realpath(repo_root) if repo_root else "__auto__"
+    api = _API_CACHE.get(key)
+    if api is None:
+        api = _API_CACHE[key] = TemplateAPI(repo_root)
+    return api
 
 
 # Example usage for testing
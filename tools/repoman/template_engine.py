@@ -178,6 +178,11 @@ class TemplateDiscovery:
                 self._registry_cache = {}
         return self._registry_cache
 
+    def invalidate(self) -> None:
+        """Drop the cached registry and templates so the next call re-discovers."""
+        self._templates_cache = None
+        self._registry_cache = None
+
     def discover_templates(self) -> Dict[str, Dict[str, Any]]:
         """Discover all templates using the registry configuration."""
         if self._templates_cache is not None:
@@ -1039,6 +1044,7 @@ def main():
         print("  --version=<version>   Version in semver format (required)")
         print("  --config=<file>       Configuration file to use")
         print("  --output-dir=<dir>    Output directory for standalone projects")
+        print("  --hardlink            Hardlink packman into standalone projects (read-only use)")
         print("  --add-layers          Add application layers (e.g., streaming)")
         print("  --layers=<l1,l2>      Comma-separated list of layer templates")
         print("  --accept-license      Accept license terms non-interactively")
@@ -1168,6 +1174,7 @@ def handle_generate_command(engine: TemplateEngine, template_name: str, args: Li
     verbose = False
     quiet = False
     standalone = False
+    hardlink = False
     per_app_deps = False
 
     for arg in args:
@@ -1191,6 +1198,8 @@ def handle_generate_command(engine: TemplateEngine, template_name: str, args: Li
             quiet = True
         elif arg == '--standalone':
             standalone = True
+        elif arg == '--hardlink':
+            hardlink = True
         elif arg == '--per-app-deps':
             per_app_deps = True
         elif arg.startswith('--'):
@@ -1268,7 +1277,8 @@ def handle_generate_command(engine: TemplateEngine, template_name: str, args: Li
                 'template_name': template_name,
                 'app_name': app_name,
                 'template_type': template_type,
-                'template_output_path': str(template_output_path)
+                'template_output_path': str(template_output_path),
+                'hardlink': hardlink
             }
 
             if verbose:
@@ -16,16 +16,22 @@ Usage:
     success = prefetch_extensions(Path("my_app.kit"))
 """
 
+import contextlib
+import io
 import json
 import logging
+import os
 import sys
 import time
+from concurrent.futures import ProcessPoolExecutor
 import urllib.request
 import urllib.error
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional, Set
 from urllib.parse import urljoin
 
+from registry_cache import get_or_fetch
+
 logger = logging.getLogger(__name__)
 
 try:
@@ -165,16 +171,23 @@ def validate_kit_file(
     kit_file: Path,
     repo_root: Path,
     check_registry: bool = True,
-    config: str = 'release'
+    config: str = 'release',
+    use_cache: bool = True,
+    refresh_cache: bool = False
 ) -> Tuple[bool, List[str]]:
     """
     Validate all dependencies in a .kit file can be resolved.
 
+    Registry answers are cached on disk (see registry_cache), so validating
+    several .kit files that share extensions queries each one only once.
+
     Args:
         kit_file: Path to .kit file
         repo_root: Repository root path
         check_registry: Whether to query online registries
         config: Build config (release/debug)
+        use_cache: Consult the on-disk registry cache
+        refresh_cache: Re-query registries and overwrite cached answers
 
     Returns:
         Tuple of (all_valid, list_of_error_messages)
@@ -217,10 +230,17 @@ def validate_kit_file(
         found_in_registry = False
         if check_registry:
             for registry in registries:
-                version = query_extension_in_registry(
-                    ext_name,
-                    registry['url']
-                )
+                if use_cache:
+                    version = get_or_fetch(
+                        f"{registry['url']}|{ext_name}",
+                        lambda: query_extension_in_registry(ext_name, registry['url']),
+                        refresh=refresh_cache
+                    )
+                else:
+                    version = query_extension_in_registry(
+                        ext_name,
+                        registry['url']
+                    )
                 if version:
                     found_registry += 1
                     found_in_registry = True
@@ -304,20 +324,46 @@ def prefetch_extensions(
         return False
 
 
+def _validate_kit_file_captured(
+    kit_file: Path,
+    repo_root: Path,
+    check_registry: bool,
+    config: str,
+    use_cache: bool,
+    refresh_cache: bool
+) -> Tuple[bool, List[str], str]:
+    """Run validate_kit_file in a worker, returning its report text as well."""
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        valid, errors = validate_kit_file(kit_file, repo_root, check_registry, config,
+                                          use_cache, refresh_cache)
+    return valid, errors, out.getvalue()
+
+
 def validate_all_kit_files(
     repo_root: Path,
     check_registry: bool = True,
     config: str = 'release',
-    fail_fast: bool = False
+    fail_fast: bool = False,
+    jobs: int = 1,
+    use_cache: bool = True,
+    refresh_cache: bool = False
 ) -> Tuple[bool, Dict[str, List[str]]]:
     """
     Validate all .kit files in the repository.
 
+    With jobs > 1 the files are validated in a process pool. Each worker's
+    report is buffered and printed in file order, so the output matches a
+    serial run.
+
     Args:
         repo_root: Repository root path
         check_registry: Whether to query online registries
         config: Build config (release/debug)
         fail_fast: Stop on first error
+        jobs: Number of worker processes
+        use_cache: Consult the on-disk registry cache
+        refresh_cache: Re-query registries and overwrite cached answers
 
     Returns:
         Tuple of (all_valid, dict_of_errors_by_kit_file)
@@ -338,8 +384,32 @@ def validate_all_kit_files(
     all_valid = True
     all_errors = {}
 
+    jobs = min(jobs or 1, len(kit_files))
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(_validate_kit_file_captured, kit_file, repo_root,
+                            check_registry, config, use_cache, refresh_cache)
+                for kit_file in kit_files
+            ]
+            for kit_file, future in zip(kit_files, futures):
+                valid, errors, report = future.result()
+                sys.stdout.write(report)
+
+                if not valid:
+                    all_valid = False
+                    all_errors[str(kit_file)] = errors
+
+                    if fail_fast:
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+        return all_valid, all_errors
+
     for kit_file in kit_files:
-        valid, errors = validate_kit_file(kit_file, repo_root, check_registry, config)
+        valid, errors = validate_kit_file(kit_file, repo_root, check_registry, config,
+                                          use_cache, refresh_cache)
 
         if not valid:
             all_valid = False
@@ -351,8 +421,13 @@ def validate_all_kit_files(
     return all_valid, all_errors
 
 
-def main():
-    """CLI entry point for validation."""
+def main(argv: Optional[List[str]] = None):
+    """
+    CLI entry point for validation.
+
+    Args:
+        argv: Argument list to parse (default: sys.argv[1:])
+    """
     import argparse
 
     parser = argparse.ArgumentParser(
@@ -390,13 +465,29 @@ def main():
         action='store_true',
         help='Stop on first validation error'
     )
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        default=os.cpu_count() or 1,
+        help='Number of .kit files to validate in parallel (default: CPU count)'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Bypass the on-disk registry lookup cache'
+    )
+    parser.add_argument(
+        '--refresh-cache',
+        action='store_true',
+        help='Re-query registries and refresh the lookup cache'
+    )
     parser.add_argument(
         '-v', '--verbose',
         action='store_true',
         help='Verbose output'
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Setup logging
     log_level = logging.DEBUG if args.verbose else logging.INFO
@@ -432,7 +523,9 @@ def main():
             args.kit_file,
             args.repo_root,
             check_registry,
-            args.config
+            args.config,
+            not args.no_cache,
+            args.refresh_cache
         )
 
         if not valid:
@@ -449,7 +542,10 @@ def main():
             args.repo_root,
             check_registry,
             args.config,
-            args.fail_fast
+            args.fail_fast,
+            args.jobs,
+            not args.no_cache,
+            args.refresh_cache
         )
 
         if not all_valid: